@@ -1,42 +1,131 @@
 import asyncio
+import time
 from playwright.async_api import async_playwright
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from geopy.geocoders import Nominatim
+from geopy.adapters import RequestsAdapter
 from geopy.location import Location
 import re
 import json
+import html
+from html.parser import HTMLParser
 from storage_manager import RestaurantStorageManager
 import os
 
 # 타임아웃 상수 (ms)
 TIMEOUT = 10000
 
+# 스크롤 후 새 식당이 로드되지 않으면 종료하는 대기 시간 (ms)
+SCROLL_IDLE_TIMEOUT = 1500
+
+# 상세 정보 동시 요청 개수
+DETAIL_CONCURRENCY = 8
+
+# Nominatim 요청 최소 간격 (초, 이용 정책상 초당 1회)
+GEOCODE_MIN_INTERVAL = 1.0
+
+# 재사용할 상세 페이지 최대 개수
+DETAIL_PAGE_POOL_SIZE = 4
+
+# 주소 정제를 위한 정규표현식 (도로명 주소에서 상세 주소 제거)
+# \w가 숫자를 포함하므로 \w+\d*\w* 대신 \w+ 사용 (매칭 결과는 같고 백트래킹만 줄어듦)
+ADDRESS_PATTERN = re.compile(
+    r"(\w+[원산남울북천주기시도]\s*)?"
+    r"(\w+[구시군]\s*)?(\w+[구시]\s*)?"
+    r"(\w+[면읍]\s*)?"
+    r"(\w+[동리로길]\s*)?"
+    r"(\w*\d+-?\d*)?"
+)
+
+# URL에서 place_id 추출
+PLACE_ID_PATTERN = re.compile(r"/place/(\d+)")
+
+# 상세 페이지 HTML에서 주소(span.LDgIH) 추출
+ADDRESS_HTML_PATTERN = re.compile(r'<span class="LDgIH">([^<]+)</span>')
+
+# 썸네일 이미지(img.K0PDV)를 감싸는 div class (div.uDR4i div.CEX4u div.fNygA 순서)
+THUMBNAIL_CONTAINER_CLASSES = ("uDR4i", "CEX4u", "fNygA")
+
+# 텍스트 추출에 불필요한 리소스 (이미지, 폰트, 미디어)
+# (확장자가 없거나 쿼리스트링이 붙은 URL도 막을 수 있도록 resource_type 기준)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# 분석/트래킹 요청
+BLOCKED_TRACKER_PATTERN = re.compile(
+    r"(google-analytics\.com|googletagmanager\.com|doubleclick\.net"
+    r"|wcs\.naver\.net|lcs\.naver\.com)"
+)
+
+
+class ThumbnailParser(HTMLParser):
+    """상세 페이지 HTML에서 div.uDR4i div.CEX4u div.fNygA img.K0PDV의 첫 번째 src 추출
+    (페이지의 다른 img.K0PDV는 썸네일로 사용하지 않음)"""
+
+    def __init__(self):
+        super().__init__()
+        # 현재 열려 있는 div들의 class 목록 (바깥쪽부터)
+        self._div_classes = []
+        self.src = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.src is not None:
+            return
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        if tag == "div":
+            self._div_classes.append(classes)
+        elif tag == "img" and "K0PDV" in classes and self._in_container():
+            self.src = attrs.get("src") or ""
+
+    def handle_endtag(self, tag):
+        if tag == "div" and self._div_classes:
+            self._div_classes.pop()
+
+    def _in_container(self) -> bool:
+        # 열린 div 중에 uDR4i -> CEX4u -> fNygA가 순서대로 있는지 확인
+        # (같은 iterator를 이어서 사용하므로 앞의 class 다음 위치부터 찾음)
+        open_divs = iter(self._div_classes)
+        return all(
+            any(name in classes for classes in open_divs)
+            for name in THUMBNAIL_CONTAINER_CLASSES
+        )
+
 
 class NaverMapRestaurantCrawler:
     def __init__(self, headless: bool = True):
         self.headless = headless
-        self.geolocator = Nominatim(user_agent="myGeocoder")
+        # requests.Session 기반 어댑터로 Nominatim 연결 재사용 (keep-alive)
+        self.geolocator = Nominatim(
+            user_agent="myGeocoder", adapter_factory=RequestsAdapter
+        )
+        # 2단계 캐시 (모든 페이지 크롤링 작업이 공유)
+        # 1) 원본 주소 -> 정제된 주소: 같은 건물/도로의 주소 정제 재실행 방지
+        # 2) 정제된 주소 -> 좌표: 같은 주소는 Nominatim에 다시 요청하지 않음
+        #    (load_coordinates_cache로 이전 실행 결과를 불러올 수 있음)
+        self._cleaned_address_cache: Dict[str, str] = {}
+        self._coordinates_cache: Dict[str, Optional[Tuple[float, float]]] = {}
+        # Nominatim 요청은 한 번에 하나씩, GEOCODE_MIN_INTERVAL 간격으로만 보냄
+        self._geocode_lock = asyncio.Lock()
+        self._last_geocode_time = 0.0
+        # 상세 페이지 풀 (필요할 때 DETAIL_PAGE_POOL_SIZE개까지만 생성 후 재사용)
+        self._detail_pool: asyncio.Queue = asyncio.Queue(maxsize=DETAIL_PAGE_POOL_SIZE)
+        self._detail_pages = []
+        # 생성했거나 생성 중인 상세 페이지 수
+        self._detail_page_count = 0
 
     def clean_address(self, address: str) -> str:
         """도로명 주소에서 상세 주소 제거"""
         if not address:
             return ""
 
-        # 주소 정제를 위한 정규표현식
-        regex = (
-            r"(\w+[원,산,남,울,북,천,주,기,시,도]\s*)?"
-            r"(\w+[구,시,군]\s*)?(\w+[구,시]\s*)?"
-            r"(\w+[면,읍]\s*)"
-            r"?(\w+\d*\w*[동,리,로,길]\s*)"
-            r"?(\w*\d+-?\d*)?"
-        )
-
-        match = re.search(regex, address)
-        if match:
-            return match.group().strip()
-        return address
+        cleaned_address = self._cleaned_address_cache.get(address)
+        if cleaned_address is None:
+            match = ADDRESS_PATTERN.search(address)
+            cleaned_address = match.group().strip() if match else address
+            self._cleaned_address_cache[address] = cleaned_address
+        return cleaned_address
 
-    def get_coordinates(self, address: str) -> Optional[Tuple[float, float]]:
+    async def get_coordinates(self, address: str) -> Optional[Tuple[float, float]]:
         """주소로부터 위도, 경도 추출"""
         if not address:
             return None
@@ -44,13 +133,89 @@ class NaverMapRestaurantCrawler:
         # 주소 정제
         cleaned_address = self.clean_address(address)
 
-        # 지오코딩 (geopy의 geocode는 동기 함수임)
-        location = self.geolocator.geocode(cleaned_address)
+        # 이미 지오코딩한 주소는 캐시 결과 사용
+        if cleaned_address in self._coordinates_cache:
+            return self._coordinates_cache[cleaned_address]
+
+        async with self._geocode_lock:
+            # 대기하는 동안 다른 작업이 같은 주소를 지오코딩했을 수 있음
+            if cleaned_address in self._coordinates_cache:
+                return self._coordinates_cache[cleaned_address]
+
+            wait_time = GEOCODE_MIN_INTERVAL - (
+                time.monotonic() - self._last_geocode_time
+            )
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+
+            # 지오코딩 (geopy의 geocode는 동기 함수라서 스레드에서 실행해 이벤트 루프를 막지 않음)
+            try:
+                location = await asyncio.to_thread(
+                    self.geolocator.geocode, cleaned_address
+                )
+            finally:
+                self._last_geocode_time = time.monotonic()
+
         # location이 None이 아니고, geopy.location.Location 타입이어야 함
         if isinstance(location, Location):
-            return (location.latitude, location.longitude)
+            coordinates = (location.latitude, location.longitude)
         else:
-            return None
+            coordinates = None
+        self._coordinates_cache[cleaned_address] = coordinates
+        return coordinates
+
+    def load_coordinates_cache(self, coordinates_cache: Dict[str, List[float]]):
+        """이전 실행에서 저장한 지오코딩 결과(정제된 주소 -> [위도, 경도]) 불러오기"""
+        for cleaned_address, coordinates in coordinates_cache.items():
+            self._coordinates_cache[cleaned_address] = tuple(coordinates)
+
+    def dump_coordinates_cache(self) -> Dict[str, List[float]]:
+        """저장할 지오코딩 결과 반환 (좌표를 찾지 못한 주소는 다음 실행에서 다시 시도)"""
+        return {
+            cleaned_address: list(coordinates)
+            for cleaned_address, coordinates in self._coordinates_cache.items()
+            if coordinates
+        }
+
+    async def _block_resources(self, context):
+        """이미지/폰트/미디어 및 트래킹 요청 차단 (context 단위라 모든 page에 적용)"""
+
+        async def handle_route(route):
+            request = route.request
+            if request.resource_type in BLOCKED_RESOURCE_TYPES or (
+                BLOCKED_TRACKER_PATTERN.search(request.url)
+            ):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", handle_route)
+
+    async def _acquire_detail_page(self, context):
+        """상세 페이지 풀에서 page 가져오기 (풀이 비어 있고 여유가 있으면 새로 생성)"""
+        if (
+            self._detail_pool.empty()
+            and self._detail_page_count < DETAIL_PAGE_POOL_SIZE
+        ):
+            # new_page를 기다리는 동안 다른 코루틴이 같은 자리를 차지하지 않도록 먼저 예약
+            self._detail_page_count += 1
+            try:
+                detail_page = await context.new_page()
+            except BaseException:
+                self._detail_page_count -= 1
+                raise
+            self._detail_pages.append(detail_page)
+            return detail_page
+        return await self._detail_pool.get()
+
+    async def close_detail_pages(self):
+        """상세 페이지 풀 정리"""
+        while not self._detail_pool.empty():
+            self._detail_pool.get_nowait()
+        for detail_page in self._detail_pages:
+            await detail_page.close()
+        self._detail_pages = []
+        self._detail_page_count = 0
 
     def _get_launch_options(self) -> dict:
         """브라우저 실행 옵션 반환"""
@@ -60,26 +225,7 @@ class NaverMapRestaurantCrawler:
                 "--no-sandbox",
                 "--disable-dev-shm-usage",
                 "--disable-blink-features=AutomationControlled",
-                "--disable-features=IsolateOrigins,site-per-process",
-                "--disable-web-security",
-                "--disable-site-isolation-trials",
-                "--no-first-run",
-                "--no-default-browser-check",
-                "--disable-gpu",
-                "--disable-extensions",
-                "--disable-default-apps",
-                "--disable-sync",
-                "--disable-translate",
-                "--hide-scrollbars",
-                "--metrics-recording-only",
                 "--mute-audio",
-                "--safebrowsing-disable-auto-update",
-                "--ignore-certificate-errors",
-                "--ignore-ssl-errors",
-                "--ignore-certificate-errors-spki-list",
-                "--disable-setuid-sandbox",
-                "--window-size=1920,1080",
-                "--start-maximized",
             ],
         }
 
@@ -96,6 +242,8 @@ class NaverMapRestaurantCrawler:
             "device_scale_factor": 1,
             "is_mobile": False,
             "has_touch": False,
+            "service_workers": "block",
+            "bypass_csp": True,
             "extra_http_headers": {
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
                 "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
@@ -113,47 +261,53 @@ class NaverMapRestaurantCrawler:
         }
 
     async def _scroll_to_load_all(self, frame):
-        """모든 데이터가 로드될 때까지 스크롤"""
-        previous_count = 0
-        no_change_count = 0
-        max_no_change = 3  # 3번 연속으로 변화가 없으면 종료
-
-        while True:
-            # 현재 로드된 식당 수 확인
-            current_restaurants = await frame.query_selector_all("li.UEzoS")
-            current_count = len(current_restaurants)
-
-            # 변화가 없으면 카운트 증가
-            if current_count == previous_count:
-                no_change_count += 1
-
-                if no_change_count >= max_no_change:
-                    print("더 이상 로드할 데이터가 없습니다.")
-                    break
-            else:
-                no_change_count = 0  # 변화가 있으면 카운트 리셋
-
-            previous_count = current_count
-
-            # 스크롤 실행
-            await frame.evaluate(
-                """
-                () => {
-                    const scrollContainer = document.querySelector('.Ryr1F') || 
-                                           document.querySelector('[role="main"]') || 
-                                           document.body;
-                    
-                    if (scrollContainer) {
-                        scrollContainer.scrollTop = scrollContainer.scrollHeight;
-                    } else {
-                        window.scrollTo(0, document.body.scrollHeight);
+        """모든 데이터가 로드될 때까지 스크롤
+
+        스크롤 후 식당 목록이 늘어나면 바로 다음 스크롤을 하고,
+        SCROLL_IDLE_TIMEOUT 동안 늘어나지 않으면 종료
+        """
+        loaded_count = await frame.evaluate(
+            """
+            async (idleTimeout) => {
+                const selector = 'li.UEzoS';
+                const scrollContainer = document.querySelector('.Ryr1F') ||
+                                       document.querySelector('[role="main"]') ||
+                                       document.body;
+                let lastCount = document.querySelectorAll(selector).length;
+
+                while (true) {
+                    scrollContainer.scrollTop = scrollContainer.scrollHeight;
+
+                    // 식당 목록이 늘어나거나 idleTimeout이 지날 때까지 대기
+                    const grew = await new Promise((resolve) => {
+                        const timer = setTimeout(() => {
+                            observer.disconnect();
+                            resolve(false);
+                        }, idleTimeout);
+                        const observer = new MutationObserver(() => {
+                            const count = document.querySelectorAll(selector).length;
+                            if (count > lastCount) {
+                                lastCount = count;
+                                clearTimeout(timer);
+                                observer.disconnect();
+                                resolve(true);
+                            }
+                        });
+                        observer.observe(scrollContainer, {
+                            childList: true,
+                            subtree: true,
+                        });
+                    });
+
+                    if (!grew) {
+                        return lastCount;
                     }
                 }
-            """
-            )
-
-            # 새로운 데이터 로딩 대기
-            await asyncio.sleep(2)
+            }
+            """,
+            SCROLL_IDLE_TIMEOUT,
+        )
+        print(f"더 이상 로드할 데이터가 없습니다. (총 {loaded_count}개)")
 
     async def _navigate_to_page(self, frame, page_num: int):
         """특정 페이지로 이동"""
@@ -161,88 +315,136 @@ class NaverMapRestaurantCrawler:
             page_link = await frame.query_selector(f"a.mBN2s:has-text('{page_num}')")
             if not page_link:
                 raise Exception("해당 페이지 없음")
+            # 고정 대기 대신 목록의 첫 식당이 바뀔 때까지만 대기
+            first_item_text = await frame.evaluate(
+                "() => { const li = document.querySelector('li.UEzoS'); "
+                "return li ? li.innerText : null; }"
+            )
             await page_link.click()
-            await asyncio.sleep(3)
+            await frame.wait_for_function(
+                "(prev) => { const li = document.querySelector('li.UEzoS'); "
+                "return li !== null && li.innerText !== prev; }",
+                arg=first_item_text,
+                timeout=TIMEOUT,
+            )
             await frame.wait_for_selector("li.UEzoS", state="visible", timeout=TIMEOUT)
 
-    async def _extract_basic_info(self, restaurant):
-        """식당 기본 정보 추출"""
-        # 식당 이름 정보
-        name_elem = await restaurant.query_selector("span.TYaxT")
-        name = await name_elem.inner_text() if name_elem else "이름 없음"
-
-        # 식당 카테고리 정보
-        category_elem = await restaurant.query_selector("span.KCMnt")
-        category = await category_elem.inner_text() if category_elem else ""
-
-        return name, category
-
-    async def _extract_place_id(self, restaurant, page):
-        """place_id 추출"""
-        place_id = None
-        link_elem = await restaurant.query_selector("a.place_bluelink")
+    async def _extract_basic_infos(self, frame) -> List[Tuple[str, str, str]]:
+        """목록의 모든 식당 기본 정보(이름, 카테고리, place_id)를 한 번의 evaluate로 추출"""
+        rows = await frame.evaluate(
+            """
+            () => Array.from(document.querySelectorAll('li.UEzoS')).map((li) => {
+                const name = li.querySelector('span.TYaxT');
+                const category = li.querySelector('span.KCMnt');
+                const link = li.querySelector('a.place_bluelink');
+                const item = link ? link.closest('[data-id]') : null;
+                return {
+                    name: name ? name.innerText : '이름 없음',
+                    category: category ? category.innerText : '',
+                    href: link ? link.getAttribute('href') || '' : null,
+                    dataId: item ? item.dataset.id : null,
+                };
+            })
+            """
+        )
 
-        if link_elem:
-            # 클릭
-            await link_elem.click()
+        basic_infos = []
+        for row in rows:
+            place_id = None
+            if row["href"] is not None:
+                # 링크 href에서 place ID 추출, 없으면 data-id 속성 사용
+                match = PLACE_ID_PATTERN.search(row["href"])
+                place_id = match.group(1) if match else row["dataId"]
+            basic_infos.append((row["name"], row["category"], place_id))
 
-            # URL 변경 대기 (최대 3초)
-            await page.wait_for_url(lambda url: "/place/" in url, timeout=TIMEOUT)
+        return basic_infos
 
-            # 변경된 URL에서 place ID 추출
-            new_url = page.url
-            match = re.search(r"/place/(\d+)", new_url)
-            if match:
-                place_id = match.group(1)
+    async def _fetch_address_and_thumbnail(self, place_id, context):
+        """상세 페이지를 열지 않고 HTML만 요청해서 주소 및 썸네일 url 추출"""
+        place_detail_url = f"https://pcmap.place.naver.com/place/{place_id}"
+        try:
+            response = await context.request.get(place_detail_url, timeout=TIMEOUT)
+            if not response.ok:
+                return None, ""
+            detail_html = await response.text()
+        except Exception as e:
+            print(f"상세 정보 요청 실패 ({place_id}): {str(e)}")
+            return None, ""
+
+        address_match = ADDRESS_HTML_PATTERN.search(detail_html)
+        if not address_match:
+            return None, ""
+        address = html.unescape(address_match.group(1)).strip()
+
+        # 썸네일은 기존 selector와 같은 div 안의 이미지만 사용
+        # (속성 값의 HTML entity는 HTMLParser가 풀어 줌)
+        thumbnail_parser = ThumbnailParser()
+        thumbnail_parser.feed(detail_html)
+        thumbnail_url = thumbnail_parser.src or ""
+
+        return address, thumbnail_url
+
+    async def _extract_address_and_thumbnail_from_page(self, place_id, context):
+        """상세 페이지를 열어서 주소 및 썸네일 url 추출"""
+        place_detail_url = f"https://pcmap.place.naver.com/place/{place_id}"
+        detail_page = await self._acquire_detail_page(context)
+        try:
+            await detail_page.goto(place_detail_url)
+            await detail_page.wait_for_selector("span.LDgIH", timeout=TIMEOUT)
+
+            # 주소 정보
+            address_elem = await detail_page.query_selector("span.LDgIH")
+            address = await address_elem.inner_text()
+
+            # 식당 썸네일 이미지 url
+            thumbnail_url = ""
+            for index in range(3):  # 0, 1, 2
+                thumbnail_elem = await detail_page.query_selector(
+                    f"div.uDR4i div.CEX4u div.fNygA img.K0PDV"
+                )
+                if thumbnail_elem:
+                    thumbnail_url = await thumbnail_elem.get_attribute("src")
+                    break
+        finally:
+            # 닫지 않고 풀에 반환해서 다음 식당에 재사용
+            self._detail_pool.put_nowait(detail_page)
 
-        return place_id
+        return address, thumbnail_url
 
-    async def _extract_address_and_thumbnail_info(self, place_id, context):
-        """주소 및 좌표 정보 추출"""
-        address = None
+    async def _extract_address_and_thumbnail_info(self, place_id, context, semaphore):
+        """주소 및 좌표 정보 추출
+        상세 정보 요청만 semaphore로 동시 실행 개수를 제한하고, 지오코딩은 그 밖에서 대기"""
         cleaned_address = None
         latitude = None
         longitude = None
-        place_detail_url = f"https://pcmap.place.naver.com/place/{place_id}"
-        detail_page = await context.new_page()
-
-        await detail_page.goto(place_detail_url)
-        await detail_page.wait_for_selector("span.LDgIH", timeout=TIMEOUT)
 
-        # 주소 정보
-        address_elem = await detail_page.query_selector("span.LDgIH")
-        address = await address_elem.inner_text()
-
-        # 식당 썸네일 이미지 url
-        thumbnail_url = ""
-        for index in range(3):  # 0, 1, 2
-            thumbnail_elem = await detail_page.query_selector(
-                f"div.uDR4i div.CEX4u div.fNygA img.K0PDV"
+        async with semaphore:
+            # HTML 요청으로 먼저 시도하고, 실패한 경우에만 상세 페이지 열기
+            address, thumbnail_url = await self._fetch_address_and_thumbnail(
+                place_id, context
             )
-            if thumbnail_elem:
-                thumbnail_url = await thumbnail_elem.get_attribute("src")
-                break
+            if not address:
+                address, thumbnail_url = (
+                    await self._extract_address_and_thumbnail_from_page(
+                        place_id, context
+                    )
+                )
 
         # 주소 정제 및 지오코딩
         if address:
             cleaned_address = self.clean_address(address)
-            coordinates = self.get_coordinates(cleaned_address)
+            coordinates = await self.get_coordinates(cleaned_address)
             if coordinates:
                 latitude, longitude = coordinates
 
-        await detail_page.close()
-
         return address, cleaned_address, latitude, longitude, thumbnail_url
 
     async def _extract_restaurant_data(
-        self, restaurant, page, context, page_num: int
+        self, name, category, place_id, context, page_num: int, semaphore
     ) -> dict:
         """단일 식당 데이터 추출"""
-        name, category = await self._extract_basic_info(restaurant)
-        place_id = await self._extract_place_id(restaurant, page)
-
         address, cleaned_address, latitude, longitude, thumbnail_url = (
-            await self._extract_address_and_thumbnail_info(place_id, context)
+            await self._extract_address_and_thumbnail_info(place_id, context, semaphore)
         )
 
         print(
@@ -264,23 +466,22 @@ class NaverMapRestaurantCrawler:
             "longitude": longitude,
         }
 
-        await page.go_back()
         return result
 
-    async def crawl_single_page(self, search_query: str, page_num: int) -> List[Dict]:
-        """특정 페이지 하나만 크롤링"""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(**self._get_launch_options())
-            context = await browser.new_context(**self._get_context_options())
-            page = await context.new_page()
-
-            await page.route(
-                "**/*.{png,jpg,jpeg,gif,svg,webp}", lambda route: route.abort()
-            )
-
+    async def crawl_single_page(
+        self,
+        search_query: str,
+        page_num: int,
+        context,
+        existing_place_ids: Optional[Set[str]] = None,
+    ) -> List[Dict]:
+        """특정 페이지 하나만 크롤링
+        브라우저/컨텍스트는 호출하는 쪽에서 공유하고, 작업마다 새 page만 생성
+        existing_place_ids: 이미 수집한 place_id는 상세 정보 요청/지오코딩 없이 제외"""
+        page = await context.new_page()
+        try:
             results = []
 
-            await page.goto("https://httpbin.org/ip")
             await page.goto("https://map.naver.com/", wait_until="domcontentloaded")
 
             search_input = await page.wait_for_selector(
@@ -301,7 +502,6 @@ class NaverMapRestaurantCrawler:
                 await self._scroll_to_load_all(frame)
 
             if not frame:
-                await browser.close()
                 return results
 
             await frame.wait_for_selector("li.UEzoS", state="visible", timeout=TIMEOUT)
@@ -309,19 +509,31 @@ class NaverMapRestaurantCrawler:
             # 페이지 이동
             await self._navigate_to_page(frame, page_num)
 
-            # 데이터 추출
-            restaurants = await frame.query_selector_all("li.UEzoS")
-
-            for restaurant in restaurants:
-                result = await self._extract_restaurant_data(
-                    restaurant, page, context, page_num
-                )
-                results.append(result)
+            # 데이터 추출 (목록 페이지는 이동하지 않고 기본 정보와 place_id를 먼저 수집)
+            restaurant_infos = await self._extract_basic_infos(frame)
+            if existing_place_ids:
+                restaurant_infos = [
+                    info
+                    for info in restaurant_infos
+                    if info[2] not in existing_place_ids
+                ]
+
+            # 상세 정보는 동시에 요청
+            semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
+            results = await asyncio.gather(
+                *[
+                    self._extract_restaurant_data(
+                        name, category, place_id, context, page_num, semaphore
+                    )
+                    for name, category, place_id in restaurant_infos
+                ]
+            )
 
-            print(f"페이지 {page_num}: {len(restaurants)}개 수집")
+            print(f"페이지 {page_num}: 신규 {len(restaurant_infos)}개 수집")
 
-            await browser.close()
             return results
+        finally:
+            await page.close()
 
 
 # 사용 예시
@@ -350,29 +562,31 @@ async def main():
         )
 
         crawler = NaverMapRestaurantCrawler(headless=True)
+        crawler.load_coordinates_cache(s3_manager.get_geocode_cache())
 
-        # 2. 여러 페이지 동시 실행
-        tasks = [
-            crawler.crawl_single_page(search_query, 1),
-            crawler.crawl_single_page(search_query, 2),
-            crawler.crawl_single_page(search_query, 3),
-            crawler.crawl_single_page(search_query, 4),
-        ]
-
-        # 3. 모든 결과 대기
-        all_results = await asyncio.gather(*tasks)
+        # 2. 브라우저/컨텍스트는 한 번만 띄우고 여러 페이지 동시 실행
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(**crawler._get_launch_options())
+            try:
+                context = await browser.new_context(**crawler._get_context_options())
+                await crawler._block_resources(context)
+                tasks = [
+                    crawler.crawl_single_page(
+                        search_query, page_num, context, existing_place_ids
+                    )
+                    for page_num in range(1, 5)
+                ]
+
+                # 3. 모든 결과 대기
+                all_results = await asyncio.gather(*tasks)
+            finally:
+                await crawler.close_detail_pages()
+                await browser.close()
 
-        # 4. 결과 병합
-        merged_results = []
+        # 4. 결과 병합 (기존 place_id는 각 페이지 크롤링에서 이미 제외됨)
+        deduped_results = []
         for page_results in all_results:
-            merged_results.extend(page_results)
-
-        # 5. 기존 place_id와 중복 제거
-        deduped_results = [
-            item
-            for item in merged_results
-            if item["place_id"] not in existing_place_ids
-        ]
+            deduped_results.extend(page_results)
 
         print(f"\n총 {len(deduped_results)}개 신규 식당 수집")
         for i, restaurant in enumerate(deduped_results, 1):
@@ -385,12 +599,15 @@ async def main():
                 f"[thumbnail_url: {restaurant['thumbnail_url']}]"
             )
 
-        # 6. S3에 업로드 (신규만)
+        # 5. S3에 업로드 (신규만)
         if deduped_results:
             s3_manager.upload_restaurants_json(search_query, deduped_results)
         else:
             print("신규 식당 없음, 업로드 생략")
 
+        # 6. 지오코딩 캐시 저장 (다음 실행에서 재사용)
+        s3_manager.upload_geocode_cache(crawler.dump_coordinates_cache())
+
     except Exception as e:
         import traceback
 
@@ -1,5 +1,23 @@
 import boto3
-import json
+from botocore.config import Config
+import orjson
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# S3 클라이언트 설정 (연결 풀/keep-alive 재사용, 적응형 재시도)
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "total_max_attempts": 5},
+)
+
+# 지오코딩 결과 캐시 파일 (정제된 주소 -> [위도, 경도])
+# 식당 파일과 섞이지 않도록 별도 prefix에 저장 (submit-aws-batch Lambda는 _cache/ 파일을 건너뜀)
+GEOCODE_CACHE_KEY = "_cache/geocode_cache.json"
+
+# 식당 파일별 S3 Select 동시 실행 개수
+SELECT_MAX_WORKERS = 8
 
 
 class RestaurantStorageManager:
@@ -9,79 +27,124 @@ class RestaurantStorageManager:
         aws_access_key_id=None,
         aws_secret_access_key=None,
         region_name=None,
+        s3_client=None,
     ):
         self.bucket_name = bucket_name
-        self.s3 = boto3.client(
+        # 클라이언트를 넘겨받으면 재사용 (Lambda warm start 시 연결 유지)
+        self.s3 = s3_client or boto3.client(
             "s3",
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=region_name,
+            config=S3_CLIENT_CONFIG,
         )
 
     def upload_restaurants_json(self, query, restaurants):
         """
-        식당 리스트(restaurants)를 S3의 bucket에 place_id.json 파일로 저장
-        기존 파일이 있으면 합치기
+        이번에 수집한 식당 리스트(restaurants)만 S3의 query/ 아래 새 파일로 저장
+        기존 파일을 다시 읽고 쓰지 않음 (크롤링마다 파일 하나씩 추가)
         """
-        key = f"{query}.json"
+        key = f"{query}/{int(time.time())}-{uuid.uuid4().hex[:8]}.json"
 
-        # 기존 파일 확인 및 읽기
-        existing_reviews = []
-        try:
-            response = self.s3.get_object(Bucket=self.bucket_name, Key=key)
-            existing_data = response["Body"].read().decode("utf-8")
-            existing_reviews = json.loads(existing_data)
-            print(f"기존 리뷰 {len(existing_reviews)}개 발견")
-        except self.s3.exceptions.NoSuchKey:
-            print(f"{key} 파일이 없어서 새로 생성")
-        except Exception as e:
-            print(f"파일 읽기 오류: {e}")
-
-        # 기존 식당과 새 식당 합치기
-        all_reviews = existing_reviews + restaurants
-
-        # S3에 저장
-        data = json.dumps(all_reviews, ensure_ascii=False, indent=2)
-        self.s3.put_object(Bucket=self.bucket_name, Key=key, Body=data.encode("utf-8"))
+        self.s3.put_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=orjson.dumps(restaurants),
+            ContentType="application/json",
+        )
         print(
-            f"Uploaded {key} to S3 bucket {self.bucket_name} (총 {len(all_reviews)}개 리뷰)"
+            f"Uploaded {key} to S3 bucket {self.bucket_name} (신규 {len(restaurants)}개 식당)"
         )
 
-    def get_restaurant_ids_with_s3_select(self, query):
+    def _list_restaurant_keys(self, query):
+        """
+        query의 식당 파일 key 목록 반환 (기존 query.json + query/ 아래 파일들)
+        """
+        keys = [f"{query}.json"]
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=f"{query}/"):
+            for obj in page.get("Contents", []):
+                keys.append(obj["Key"])
+        return keys
+
+    def _select_restaurant_ids(self, key):
         """
-        S3 Select를 사용해 query.json 파일에서 식당 id만 리스트로 반환
+        S3 Select를 사용해 파일 하나에서 식당 id만 리스트로 반환
         """
-        key = f"{query}.json"
-        print(key)
         try:
+            # place_id만 projection하고, 레코드 구분자를 ","로 받아서 JSON 배열로 한 번에 파싱
             response = self.s3.select_object_content(
                 Bucket=self.bucket_name,
                 Key=key,
                 ExpressionType="SQL",
-                Expression="SELECT * FROM S3Object[*] s",
+                Expression="SELECT s.place_id FROM S3Object[*][*] s",
                 InputSerialization={"JSON": {"Type": "DOCUMENT"}},
-                OutputSerialization={"JSON": {}},
+                OutputSerialization={"JSON": {"RecordDelimiter": ","}},
             )
 
             # 모든 데이터를 먼저 수집
-            all_data = b""
+            all_data = bytearray(b"[")
             for event in response["Payload"]:
                 if "Records" in event:
                     all_data += event["Records"]["Payload"]
+            all_data = all_data.rstrip(b",") + b"]"
 
             # 한 번에 디코딩하고 처리
-            ids = []
-            if all_data:
-                records = all_data.decode("utf-8")
-                for line in records.strip().split("\n"):
-                    if line:
-                        obj = json.loads(line)["_1"]
-                        for object in obj:
-                            print(object["place_id"])
-                            ids.append(object["place_id"])
-
-            print(ids)
+            ids = [
+                record["place_id"]
+                for record in orjson.loads(all_data)
+                if "place_id" in record
+            ]
+
             return ids
         except Exception as e:
-            print(f"S3 Select error: {e}")
+            print(f"S3 Select error ({key}): {e}")
+            return []
+
+    def get_restaurant_ids_with_s3_select(self, query):
+        """
+        S3 Select를 사용해 query의 모든 식당 파일에서 식당 id만 리스트로 반환
+        파일별 S3 Select는 동시에 실행
+        """
+        try:
+            keys = self._list_restaurant_keys(query)
+        except Exception as e:
+            print(f"S3 list error: {e}")
             return []
+        print(f"식당 파일 {len(keys)}개에서 id 조회")
+
+        ids = []
+        with ThreadPoolExecutor(max_workers=SELECT_MAX_WORKERS) as executor:
+            for key_ids in executor.map(self._select_restaurant_ids, keys):
+                ids.extend(key_ids)
+
+        print(f"기존 식당 id {len(ids)}개 조회")
+        return ids
+
+    def get_geocode_cache(self):
+        """
+        S3에 저장된 지오코딩 캐시를 dict로 반환 (없으면 빈 dict)
+        """
+        try:
+            response = self.s3.get_object(
+                Bucket=self.bucket_name, Key=GEOCODE_CACHE_KEY
+            )
+            geocode_cache = orjson.loads(response["Body"].read())
+            print(f"지오코딩 캐시 {len(geocode_cache)}개 로드")
+            return geocode_cache
+        except self.s3.exceptions.NoSuchKey:
+            print(f"{GEOCODE_CACHE_KEY} 파일이 없어서 빈 캐시로 시작")
+        except Exception as e:
+            print(f"지오코딩 캐시 읽기 오류: {e}")
+        return {}
+
+    def upload_geocode_cache(self, geocode_cache):
+        """
+        지오코딩 캐시를 S3에 저장
+        """
+        self.s3.put_object(
+            Bucket=self.bucket_name,
+            Key=GEOCODE_CACHE_KEY,
+            Body=orjson.dumps(geocode_cache),
+        )
+        print(f"Uploaded {GEOCODE_CACHE_KEY} to S3 bucket {self.bucket_name}")
@@ -1,18 +1,34 @@
 import os
-from storage_manager import ReviewStorageManager
+import logging
+import asyncio
+import boto3
+from storage_manager import ReviewStorageManager, S3_CLIENT_CONFIG
 from naver_crawler import NaverMapReviewCrawler
 
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+# S3 클라이언트는 모듈 레벨에서 한 번만 생성 (warm start 시 연결 재사용)
+s3_client = boto3.client("s3", config=S3_CLIENT_CONFIG)
+
 
 # 사용 예시
 def handler(event, context):
+    asyncio.run(crawl(event))
+
+
+async def crawl(event):
+    """리뷰 크롤링 후 S3 업로드
+    event의 place_ids(리스트)는 동시에 크롤링하고, 없으면 환경변수 PLACE_ID 하나만 크롤링"""
     # 환경변수에서 S3 정보 읽기
     bucket_name = os.environ.get("S3_BUCKET_NAME")
     region_name = os.environ.get("AWS_REGION")
 
-    # 환경변수에서 place_id 읽기
-    place_id = os.environ.get("PLACE_ID")
-    if not place_id:
-        print("환경변수 PLACE_ID가 설정되어 있지 않습니다.")
+    # event 또는 환경변수에서 place_id 읽기
+    place_ids = event.get("place_ids") if isinstance(event, dict) else None
+    if not place_ids and os.environ.get("PLACE_ID"):
+        place_ids = [os.environ["PLACE_ID"]]
+    if not place_ids:
+        print("event의 place_ids 또는 환경변수 PLACE_ID가 설정되어 있지 않습니다.")
         return
     if not bucket_name:
         print("환경변수 S3_BUCKET_NAME이 설정되어 있지 않습니다.")
@@ -22,28 +38,34 @@ def handler(event, context):
     storage_manager = ReviewStorageManager(
         bucket_name=bucket_name,
         region_name=region_name,
+        s3_client=s3_client,
     )
 
     # 기존 리뷰 id set 가져오기
-    existing_ids = set(storage_manager.get_review_ids_with_s3_select(place_id))
-    print(f"기존 리뷰 {len(existing_ids)}개를 S3에서 불러옴")
-
-    # 크롤러 생성 및 크롤링
-    crawler = NaverMapReviewCrawler(headless=True)
-    reviews = crawler.crawl_all_reviews(place_id, existing_ids)
-
-    print(f"\n{'='*60}")
-    print(f"총 {len(reviews)}개 신규 리뷰 수집 완료")
-    print(f"{'='*60}")
-
-    for i, review in enumerate(reviews, 1):
-        print(f"\n[{i}] {review['author']} ({review['visit_date']})")
-        print(f"id: {review['id']}")
-        print(f"content: {review['content']}")
-
-    # S3에 업로드
-    if reviews:
-        storage_manager.upload_reviews_json(place_id, reviews)
-        print(f"{len(reviews)}개 리뷰를 S3에 업로드 완료")
-    else:
-        print("업로드할 신규 리뷰가 없습니다.")
+    existing_ids_map = {}
+    for place_id in place_ids:
+        existing_ids_map[place_id] = storage_manager.get_existing_review_ids(place_id)
+        print(
+            f"{place_id}: 기존 리뷰 {len(existing_ids_map[place_id])}개를 S3에서 불러옴"
+        )
+
+    # 크롤러 생성 및 크롤링 (브라우저 하나로 여러 place_id 동시 크롤링)
+    async with NaverMapReviewCrawler(headless=True) as crawler:
+        results = await crawler.crawl_many(place_ids, existing_ids_map)
+
+    for place_id, reviews in results.items():
+        print(f"\n{'='*60}")
+        print(f"{place_id}: 총 {len(reviews)}개 신규 리뷰 수집 완료")
+        print(f"{'='*60}")
+
+        for i, review in enumerate(reviews, 1):
+            print(f"\n[{i}] {review['author']} ({review['visit_date']})")
+            print(f"id: {review['id']}")
+            print(f"content: {review['content']}")
+
+        # S3에 업로드
+        if reviews:
+            storage_manager.upload_reviews_json(place_id, reviews)
+            print(f"{len(reviews)}개 리뷰를 S3에 업로드 완료")
+        else:
+            print("업로드할 신규 리뷰가 없습니다.")
@@ -1,4 +1,5 @@
 import os
+import asyncio
 import logging
 from storage_manager import ReviewStorageManager
 from naver_crawler import NaverMapReviewCrawler
@@ -8,14 +9,18 @@ logger = logging.getLogger(__name__)
 
 
 # 사용 예시
-def main():
+async def main():
     # 환경변수에서 S3 정보 읽기
     bucket_name = os.environ.get("S3_BUCKET_NAME")
     region_name = os.environ.get("AWS_REGION")
 
-    # 환경변수에서 place_id 읽기
-    place_id = os.environ.get("PLACE_ID")
-    if not place_id:
+    # 환경변수에서 place_id 읽기 (쉼표로 구분해서 여러 개 지정 가능)
+    place_ids = [
+        place_id.strip()
+        for place_id in os.environ.get("PLACE_ID", "").split(",")
+        if place_id.strip()
+    ]
+    if not place_ids:
         logger.error("환경변수 PLACE_ID가 설정되어 있지 않습니다.")
         return
     if not bucket_name:
@@ -29,30 +34,34 @@ def main():
     )
 
     # 기존 리뷰 id set 가져오기
-    existing_ids = set(storage_manager.get_review_ids_with_s3_select(place_id))
-    logger.info(f"기존 리뷰 {len(existing_ids)}개를 S3에서 불러옴")
-    existing_ids = set()
+    existing_ids_map = {}
+    for place_id in place_ids:
+        existing_ids_map[place_id] = storage_manager.get_existing_review_ids(place_id)
+        logger.info(
+            f"{place_id}: 기존 리뷰 {len(existing_ids_map[place_id])}개를 S3에서 불러옴"
+        )
 
-    # 크롤러 생성 및 크롤링
-    crawler = NaverMapReviewCrawler(headless=False)
-    reviews = crawler.crawl_all_reviews(place_id, existing_ids)
+    # 크롤러 생성 및 크롤링 (브라우저 하나로 여러 place_id 동시 크롤링)
+    async with NaverMapReviewCrawler(headless=False) as crawler:
+        results = await crawler.crawl_many(place_ids, existing_ids_map)
 
-    logger.info(f"\n{'='*60}")
-    logger.info(f"총 {len(reviews)}개 신규 리뷰 수집 완료")
-    logger.info(f"{'='*60}")
+    for place_id, reviews in results.items():
+        logger.info(f"\n{'='*60}")
+        logger.info(f"{place_id}: 총 {len(reviews)}개 신규 리뷰 수집 완료")
+        logger.info(f"{'='*60}")
 
-    for i, review in enumerate(reviews, 1):
-        logger.info(f"\n[{i}] {review['author']} ({review['visit_date']})")
-        logger.info(f"id: {review['id']}")
-        logger.info(f"content: {review['content']}")
+        for i, review in enumerate(reviews, 1):
+            logger.info(f"\n[{i}] {review['author']} ({review['visit_date']})")
+            logger.info(f"id: {review['id']}")
+            logger.info(f"content: {review['content']}")
 
-    # S3에 업로드
-    # if reviews:
-    #     storage_manager.upload_reviews_json(place_id, reviews)
-    #     logger.info(f"{len(reviews)}개 리뷰를 S3에 업로드 완료")
-    # else:
-    #     logger.info("업로드할 신규 리뷰가 없습니다.")
+        # S3에 업로드
+        # if reviews:
+        #     storage_manager.upload_reviews_json(place_id, reviews)
+        #     logger.info(f"{len(reviews)}개 리뷰를 S3에 업로드 완료")
+        # else:
+        #     logger.info("업로드할 신규 리뷰가 없습니다.")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,132 +1,231 @@
-from playwright.sync_api import sync_playwright
-from typing import List, Dict, Set
-import time
+from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from typing import Callable, List, Dict, FrozenSet, Set, Union
+import asyncio
 import hashlib
+import re
 import os
 import logging
+from review_id_filter import (
+    ReviewIdFilter,
+    LEGACY_REVIEW_ID_LENGTH,
+    REVIEW_ID_LENGTH,
+    get_review_id_length,
+)
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
+# 정렬/추가 로딩 대기 타임아웃 (ms)
+LOAD_TIMEOUT = 5000
+
+# place_id당 최대 수집 리뷰 수
+MAX_REVIEWS = 1000
+
+# evaluate 1회당 수집할 리뷰 수 (배치마다 2배씩 증가)
+MIN_REVIEWS_PER_BATCH = 20
+MAX_REVIEWS_PER_BATCH = 200
+
+# 텍스트 추출에 불필요한 리소스 (이미지, 폰트, 미디어)
+# (확장자가 없거나 쿼리스트링이 붙은 URL도 막을 수 있도록 resource_type 기준)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# 리뷰 조회수 추적 API
+REVIEW_VIEW_TRACKING_PATH = "/rest/visitorReview/views"
+
+# 분석/트래킹 요청
+BLOCKED_TRACKER_PATTERN = re.compile(
+    r"(google-analytics\.com|googletagmanager\.com|doubleclick\.net"
+    r"|wcs\.naver\.net|lcs\.naver\.com)"
+)
+
+# 메모리가 작은 환경(예: Lambda)에서 Chromium을 단일 프로세스로 실행 (CRAWLER_MIN_MEM=1)
+# --single-process는 BrowserContext 여러 개를 동시에 쓰면 불안정하므로
+# 이 모드에서는 crawl_many도 place_id를 하나씩 크롤링
+# (--disable-features는 Playwright가 넘기는 값을 덮어쓰므로 추가하지 않음)
+MIN_MEMORY_LAUNCH_ARGS = [
+    "--single-process",
+    "--renderer-process-limit=1",
+]
+
+
+# 자동화 탐지 우회 스크립트
+SECURITY_BYPASS_SCRIPT = """
+    // navigator.webdriver 숨기기
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => false
+    });
+
+    // Chrome 객체 추가
+    window.chrome = {
+        runtime: {},
+        loadTimes: function() {},
+        csi: function() {},
+        app: {}
+    };
+
+    // plugins 추가
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+
+    // permissions 숨기기
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+"""
+
+# 리뷰 수집 스크립트 (인자: [maxNew, timeout])
+COLLECT_REVIEWS_SCRIPT = """
+    async ([maxNew, timeout]) => {
+        const listSelector = 'ul#_review_list';
+        const itemSelector = 'ul#_review_list > li.EjjAW';
+        const rows = [];
+
+        // 새 리뷰 요소가 추가되거나 timeout이 지날 때까지 대기
+        const waitForNewItems = () => new Promise((resolve) => {
+            const list = document.querySelector(listSelector);
+            if (!list) {
+                resolve(false);
+                return;
+            }
+            const timer = setTimeout(() => {
+                observer.disconnect();
+                resolve(false);
+            }, timeout);
+            const observer = new MutationObserver(() => {
+                if (document.querySelector(itemSelector)) {
+                    clearTimeout(timer);
+                    observer.disconnect();
+                    resolve(true);
+                }
+            });
+            observer.observe(list, { childList: true });
+        });
+
+        // 현재 로드된 리뷰 추출 후 DOM에서 제거
+        const collect = async () => {
+            const items = Array.from(document.querySelectorAll(itemSelector));
+
+            // 리뷰 내용 더보기 일괄 클릭
+            // (클릭할 버튼을 먼저 모두 찾은 뒤 클릭해서 버튼마다 레이아웃을 다시 계산하지 않게 함)
+            const moreBtns = items
+                .map((li) => li.querySelector(
+                    "a.pui__wFzIYl[data-pui-click-code='rvshowmore']"
+                ))
+                .filter((btn) => btn && btn.offsetParent !== null);
+            moreBtns.forEach((btn) => btn.click());
+            if (moreBtns.length > 0) {
+                // 펼친 내용이 반영될 때까지 한 프레임 대기
+                await new Promise((resolve) => requestAnimationFrame(resolve));
+            }
+
+            for (const li of items) {
+                const author = li.querySelector('span.pui__NMi-Dp');
+                const content = li.querySelector('div.pui__vn15t2 > a');
+                const date = li.querySelector('time');
+                rows.push({
+                    author: author ? author.innerText : '익명',
+                    content: content ? content.innerText : '',
+                    visit_date: date ? date.innerText : '',
+                });
+                li.remove();
+            }
+        };
+
+        while (true) {
+            await collect();
+            if (rows.length >= maxNew) {
+                return { rows, done: false };
+            }
+
+            // 더 많은 리뷰 로드 (더보기 버튼이 없으면 스크롤)
+            const moreButton = document.querySelector('div.NSTUp a.fvwqf');
+            if (moreButton && moreButton.offsetParent !== null) {
+                moreButton.scrollIntoView();
+                moreButton.click();
+            } else {
+                window.scrollTo(0, document.body.scrollHeight);
+            }
+
+            if (!(await waitForNewItems())) {
+                return { rows, done: true };
+            }
+        }
+    }
+"""
+
 
 class NaverMapReviewCrawler:
     def __init__(self, headless: bool = True):
         self.headless = headless
+        self.min_memory = os.environ.get("CRAWLER_MIN_MEM") == "1"
+        self._playwright = None
+        self._browser = None
+
+    async def __aenter__(self):
+        """Playwright와 브라우저를 한 번만 실행해서 여러 place_id 크롤링에 재사용"""
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            **self._get_launch_options()
+        )
+        return self
 
-    def _get_fetch_bypass_script(self) -> str:
-        """fetch API 가로채기 스크립트 반환"""
-        return """
-            // fetch 함수 오버라이드
-            const originalFetch = window.fetch;
-            window.fetch = function(...args) {
-                const [url, options] = args;
-                
-                // visitorReview/views API 차단
-                if (typeof url === 'string' && url.includes('/rest/visitorReview/views')) {
-                    console.log('[Bypass] Blocked review view tracking:', url);
-                    // 즉시 204 응답 반환
-                    return Promise.resolve(new Response(null, {
-                        status: 204,
-                        statusText: 'No Content',
-                        headers: new Headers()
-                    }));
-                }
-                
-                // 다른 요청은 정상 처리
-                return originalFetch.apply(this, args);
-            };
-            
-            // XMLHttpRequest도 차단 (혹시 모를 경우 대비)
-            const originalXHR = window.XMLHttpRequest;
-            window.XMLHttpRequest = function() {
-                const xhr = new originalXHR();
-                const originalOpen = xhr.open;
-                
-                xhr.open = function(method, url, ...args) {
-                    if (url && url.includes('/rest/visitorReview/views')) {
-                        console.log('[Bypass] Blocked XHR review tracking:', url);
-                        // 가짜 응답 설정
-                        xhr.send = function() {
-                            Object.defineProperty(xhr, 'status', { value: 204 });
-                            Object.defineProperty(xhr, 'readyState', { value: 4 });
-                            xhr.onreadystatechange && xhr.onreadystatechange();
-                            xhr.onload && xhr.onload();
-                        };
-                        return;
-                    }
-                    return originalOpen.apply(this, [method, url, ...args]);
-                };
-                
-                return xhr;
-            };
-            
-            console.log('[Bypass] Review tracking API disabled successfully!');
-        """
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """브라우저 및 Playwright 종료"""
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
 
     def _get_security_bypass_script(self) -> str:
         """보안 우회 스크립트 반환"""
-        return """
-            // navigator.webdriver 숨기기
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => false
-            });
-            
-            // Chrome 객체 추가
-            window.chrome = {
-                runtime: {},
-                loadTimes: function() {},
-                csi: function() {},
-                app: {}
-            };
-            
-            // plugins 추가
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-            
-            // permissions 숨기기
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-        """
-
-    def setup_api_bypass(self, page):
-        """네이버 리뷰 조회수 추적 API 무력화"""
-        page.add_init_script(self._get_fetch_bypass_script())
-        page.add_init_script(self._get_security_bypass_script())
+        return SECURITY_BYPASS_SCRIPT
+
+    async def setup_api_bypass(self, page):
+        """자동화 탐지 우회 (리뷰 조회수 추적 API는 setup_resource_blocking에서 차단)"""
+        await page.add_init_script(self._get_security_bypass_script())
+
+    async def setup_resource_blocking(self, context):
+        """이미지/폰트/미디어 및 트래킹 요청 차단 (context 단위라 모든 page에 적용)
+        리뷰 조회수 추적 API는 네트워크 단계에서 빈 204 응답으로 처리
+        (fetch/XHR을 페이지 JS에서 덮어쓰지 않아도 됨)"""
+
+        async def handle_route(route):
+            request = route.request
+            if REVIEW_VIEW_TRACKING_PATH in request.url:
+                await route.fulfill(status=204)
+            elif request.resource_type in BLOCKED_RESOURCE_TYPES or (
+                BLOCKED_TRACKER_PATTERN.search(request.url)
+            ):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", handle_route)
 
     def _get_launch_options(self) -> dict:
         """브라우저 실행 옵션 반환"""
+        args = [
+            "--no-sandbox",
+            "--no-zygote",
+            "--disable-dev-shm-usage",
+            "--disable-blink-features=AutomationControlled",
+            "--disable-accelerated-2d-canvas",
+            "--mute-audio",
+        ]
+        if self.min_memory:
+            args.extend(MIN_MEMORY_LAUNCH_ARGS)
         return {
             "headless": self.headless,
-            "args": [
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-features=IsolateOrigins,site-per-process",
-                "--disable-web-security",
-                "--disable-site-isolation-trials",
-                "--no-first-run",
-                "--no-default-browser-check",
-                "--disable-gpu",
-                "--disable-extensions",
-                "--disable-default-apps",
-                "--disable-sync",
-                "--disable-translate",
-                "--hide-scrollbars",
-                "--metrics-recording-only",
-                "--mute-audio",
-                "--safebrowsing-disable-auto-update",
-                "--ignore-certificate-errors",
-                "--ignore-ssl-errors",
-                "--ignore-certificate-errors-spki-list",
-                "--disable-setuid-sandbox",
-                "--window-size=1920,1080",
-                "--start-maximized",
-            ],
+            "args": args,
         }
 
     def _get_context_options(self) -> dict:
@@ -142,6 +241,8 @@ class NaverMapReviewCrawler:
             "device_scale_factor": 1,
             "is_mobile": False,
             "has_touch": False,
+            "service_workers": "block",
+            "bypass_csp": True,
             "extra_http_headers": {
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
                 "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
@@ -158,86 +259,114 @@ class NaverMapReviewCrawler:
             },
         }
 
-    def _sort_by_latest(self, page):
+    async def _sort_by_latest(self, page):
         """리뷰를 최신순으로 정렬"""
-        sort_buttons = page.query_selector_all("a.place_btn_option")
-        for btn in sort_buttons:
-            btn_text = btn.inner_text()
-            if "최신순" in btn_text:
-                btn.click()
-                time.sleep(2)  # 정렬 완료 대기
-                logger.info("최신순으로 정렬됨")
-                break
+        sort_button = page.locator("a.place_btn_option", has_text="최신순").first
+        if await sort_button.count() == 0:
+            return
+
+        # 현재 첫 리뷰 요소에 표시를 남기고, 정렬 후 새 요소로 바뀔 때까지만 대기
+        # (networkidle은 요청이 끝난 뒤에도 500ms 이상 기다림)
+        await page.evaluate(
+            "() => { const li = document.querySelector('ul#_review_list > li.EjjAW'); "
+            "if (li) li.dataset.beforeSort = '1'; }"
+        )
+        await sort_button.click()
+        try:
+            await page.wait_for_function(
+                "() => { const li = document.querySelector('ul#_review_list > li.EjjAW'); "
+                "return li !== null && !li.dataset.beforeSort; }",
+                timeout=LOAD_TIMEOUT,
+            )
+        except PlaywrightTimeoutError:
+            logger.warning("최신순 정렬 대기 시간 초과")
+        logger.info("최신순으로 정렬됨")
 
     def _generate_review_id(
-        self, author_name: str, review_text: str, visit_date: str
+        self,
+        author_name: str,
+        review_text: str,
+        visit_date: str,
+        id_length: int = REVIEW_ID_LENGTH,
     ) -> str:
-        """리뷰 고유 ID 생성"""
-        hash_input = f"{author_name}|{review_text}|{visit_date}"
-        return hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
-
-    def _extract_review_data(self, elem, place_id: str) -> dict:
-        """단일 리뷰 요소에서 데이터 추출"""
-        # 작성자
-        author = elem.query_selector("span.pui__NMi-Dp")
-        author_name = author.inner_text() if author else "익명"
-
-        # 리뷰 내용 더보기 클릭
-        more_btn = elem.query_selector(
-            "a.pui__wFzIYl[data-pui-click-code='rvshowmore']"
+        """리뷰 고유 ID 생성 (중복 체크용이므로 blake2b 64bit 사용)
+        id_length: 기존 ID와 같은 길이로 생성 (64자면 SHA-256, 그 외는 blake2b)"""
+        if id_length == LEGACY_REVIEW_ID_LENGTH:
+            hasher = hashlib.sha256()
+        else:
+            hasher = hashlib.blake2b(digest_size=id_length // 2)
+
+        # "작성자|내용|방문날짜"를 하나의 문자열로 합치지 않고 필드별로 해싱
+        hasher.update(author_name.encode("utf-8"))
+        hasher.update(b"|")
+        hasher.update(review_text.encode("utf-8"))
+        hasher.update(b"|")
+        hasher.update(visit_date.encode("utf-8"))
+        return hasher.hexdigest()
+
+    def _get_review_id_length(
+        self, existing_ids: Union[Set[str], ReviewIdFilter]
+    ) -> int:
+        """기존 리뷰 ID와 같은 형식으로 ID 생성 (기존 데이터 호환)"""
+        if isinstance(existing_ids, ReviewIdFilter):
+            return existing_ids.id_length
+        return get_review_id_length(existing_ids)
+
+    def _get_collect_reviews_script(self) -> str:
+        """리뷰 수집 스크립트 반환
+
+        브라우저 안에서 "리뷰 추출 -> 더보기 클릭 -> 새 리뷰 대기"를 반복하고
+        maxNew개 이상 모이거나 더 이상 로드되는 리뷰가 없으면 결과 반환
+        (추출한 리뷰 요소는 DOM에서 제거)
+        """
+        return COLLECT_REVIEWS_SCRIPT
+
+    def _build_review_data(
+        self, row: dict, place_id: str, id_length: int = REVIEW_ID_LENGTH
+    ) -> dict:
+        """추출한 리뷰 정보에 고유 ID 부여"""
+        review_id = self._generate_review_id(
+            row["author"], row["content"], row["visit_date"], id_length
         )
-        if more_btn and more_btn.is_visible():
-            more_btn.click()
-            time.sleep(0.5)
-
-        # 리뷰 내용
-        content = elem.query_selector("div.pui__vn15t2 > a")
-        review_text = content.inner_text() if content else ""
-
-        # 방문날짜
-        date = elem.query_selector("time")
-        visit_date = date.inner_text() if date else ""
-
-        # 고유 ID 생성
-        review_id = self._generate_review_id(author_name, review_text, visit_date)
 
         return {
             "id": review_id,
             "place_id": place_id,
-            "author": author_name,
-            "content": review_text,
-            "visit_date": visit_date,
+            "author": row["author"],
+            "content": row["content"],
+            "visit_date": row["visit_date"],
         }
 
-    def _load_more_reviews(self, page):
-        """더 많은 리뷰 로드"""
-        more_button = page.query_selector("div.NSTUp a.fvwqf")
-        if more_button and more_button.is_visible():
-            more_button.scroll_into_view_if_needed()
-            more_button.click()
-            time.sleep(2)  # 새 리뷰 로딩 대기
-            return True
-        else:
-            # 더보기 버튼이 없으면 스크롤
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            time.sleep(2)
-            return False
-
-    def _process_reviews_on_page(
+    async def _process_reviews_on_page(
         self,
         page,
         place_id: str,
-        existing_ids: Set[str],
-        already_appended_ids: Set[str],
+        existing_ids: Union[FrozenSet[str], ReviewIdFilter],
+        seen_review_keys: Set[int],
+        id_length: int = REVIEW_ID_LENGTH,
+        max_new: int = MAX_REVIEWS_PER_BATCH,
     ) -> tuple:
-        """현재 페이지의 리뷰 처리"""
+        """리뷰를 max_new개 이상 로드될 때까지 브라우저 안에서 수집한 뒤 처리"""
         reviews = []
         stop_crawling = False
 
-        review_elements = page.query_selector_all("ul#_review_list > li.EjjAW")
+        result = await page.evaluate(
+            self._get_collect_reviews_script(), [max_new, LOAD_TIMEOUT]
+        )
+
+        for row in result["rows"]:
+            # 최대 수집 개수에 도달하면 남은 리뷰는 해싱하지 않고 중단
+            if len(seen_review_keys) >= MAX_REVIEWS:
+                logger.info(f"최대 {MAX_REVIEWS}개 리뷰 수집, 크롤링 중단")
+                stop_crawling = True
+                break
+
+            # 중복 체크 (이번 크롤링에서 이미 수집한 리뷰는 ID 해싱 없이 건너뜀)
+            review_key = hash((row["author"], row["content"], row["visit_date"]))
+            if review_key in seen_review_keys:
+                continue
 
-        for elem in review_elements:
-            review_data = self._extract_review_data(elem, place_id)
+            review_data = self._build_review_data(row, place_id, id_length)
             review_id = review_data["id"]
 
             # 이미 존재하는 id라면 즉시 중단
@@ -246,79 +375,129 @@ class NaverMapReviewCrawler:
                 stop_crawling = True
                 break
 
-            # 중복 체크
-            if review_id not in already_appended_ids:
-                reviews.append(review_data)
-                already_appended_ids.add(review_id)
-                page.evaluate("(element) => element.remove()", elem)
+            reviews.append(review_data)
+            seen_review_keys.add(review_key)
+
+        if not stop_crawling and len(seen_review_keys) >= MAX_REVIEWS:
+            logger.info(f"최대 {MAX_REVIEWS}개 리뷰 수집, 크롤링 중단")
+            stop_crawling = True
+
+        if not stop_crawling and result["done"]:
+            logger.info("더 이상 새로운 리뷰가 없습니다.")
+            stop_crawling = True
 
         return reviews, stop_crawling
 
-    def crawl_all_reviews(self, place_id: str, existing_ids: Set[str]) -> List[Dict]:
+    async def crawl_all_reviews(
+        self,
+        place_id: str,
+        existing_ids: Union[Set[str], ReviewIdFilter],
+        on_batch: Callable[[List[Dict]], None],
+    ) -> int:
         """네이버 지도의 모든 리뷰 크롤링
-        existing_ids: 이미 존재하는 리뷰 id의 set. 발견 시 즉시 중단 (필수)."""
-        with sync_playwright() as p:
-            browser = p.chromium.launch(**self._get_launch_options())
-            context = browser.new_context(**self._get_context_options())
-            page = context.new_page()
-            self.setup_api_bypass(page)
-
-            reviews = []
-            already_appended_ids = set()
+        existing_ids: 이미 존재하는 리뷰 id의 set 또는 ReviewIdFilter. 발견 시 즉시 중단 (필수).
+        on_batch: 수집한 리뷰 배치를 받는 콜백. 배치를 넘긴 뒤에는 리뷰를 메모리에 보관하지 않음
+        (리스트가 필요하면 reviews = []; on_batch=reviews.extend)
+        브라우저는 재사용하고 place_id마다 새 BrowserContext만 생성
+        반환값: 수집한 신규 리뷰 수"""
+        context = await self._browser.new_context(**self._get_context_options())
+        try:
+            await self.setup_resource_blocking(context)
+            page = await context.new_page()
+            await self.setup_api_bypass(page)
+
+            total_count = 0
+            seen_review_keys = set()
+            id_length = self._get_review_id_length(existing_ids)
+            if not isinstance(existing_ids, ReviewIdFilter):
+                existing_ids = frozenset(existing_ids)
 
             # 리뷰 페이지로 이동
-            page.goto("https://httpbin.org/headers")
-            page.wait_for_timeout(2000)
             url = f"https://pcmap.place.naver.com/restaurant/{place_id}/review/visitor"
-            page.goto(url)
-            page.wait_for_selector("ul#_review_list", timeout=10000)
+            await page.goto(url)
+            await page.wait_for_selector("ul#_review_list", timeout=10000)
 
             # 최신순 정렬
-            self._sort_by_latest(page)
+            await self._sort_by_latest(page)
 
-            no_new_reviews_count = 0
+            # 재크롤링 시 기존 리뷰가 앞쪽에서 바로 발견되도록 작은 배치부터 시작
+            batch_size = MIN_REVIEWS_PER_BATCH
             stop_crawling = False
 
             while not stop_crawling:
-                current_count = len(reviews)
-
-                # 현재 페이지의 리뷰 수집
-                page_reviews, stop_crawling = self._process_reviews_on_page(
-                    page, place_id, existing_ids, already_appended_ids
+                # 리뷰 수집 (기존 리뷰 발견 또는 더 이상 리뷰가 없으면 중단)
+                page_reviews, stop_crawling = await self._process_reviews_on_page(
+                    page,
+                    place_id,
+                    existing_ids,
+                    seen_review_keys,
+                    id_length,
+                    batch_size,
                 )
-                reviews.extend(page_reviews)
+                if page_reviews:
+                    on_batch(page_reviews)
+                    total_count += len(page_reviews)
 
-                logger.info(f"현재까지 {len(reviews)}개 리뷰 수집")
+                logger.info(f"현재까지 {total_count}개 리뷰 수집")
+
+                # 최대 수집 개수를 넘겨서 로드하지 않도록 배치 크기 제한
+                batch_size = min(
+                    batch_size * 2, MAX_REVIEWS_PER_BATCH, MAX_REVIEWS - total_count
+                )
 
-                if stop_crawling:
-                    break
+            return total_count
+        finally:
+            await context.close()
 
-                # 새로운 리뷰가 없으면 카운트
-                if len(reviews) == current_count:
-                    no_new_reviews_count += 1
-                    if no_new_reviews_count >= 3:
-                        logger.info("더 이상 새로운 리뷰가 없습니다.")
-                        break
-                else:
-                    no_new_reviews_count = 0
+    async def crawl_many(
+        self,
+        place_ids: List[str],
+        existing_ids_map: Dict[str, Union[Set[str], ReviewIdFilter]],
+        concurrency: int = 8,
+    ) -> Dict[str, List[Dict]]:
+        """여러 place_id의 리뷰를 동시에 크롤링 (동시 실행 수는 concurrency로 제한)
+        실패한 place_id는 로그만 남기고 결과에서 제외
+        단일 프로세스 모드(CRAWLER_MIN_MEM=1)에서는 concurrency와 관계없이 하나씩 실행"""
+        if self.min_memory:
+            concurrency = 1
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def crawl_with_semaphore(place_id: str) -> List[Dict]:
+            place_reviews = []
+            async with semaphore:
+                await self.crawl_all_reviews(
+                    place_id,
+                    existing_ids_map.get(place_id, set()),
+                    place_reviews.extend,
+                )
+            return place_reviews
 
-                # 더 많은 리뷰 로드
-                self._load_more_reviews(page)
+        all_results = await asyncio.gather(
+            *(crawl_with_semaphore(place_id) for place_id in place_ids),
+            return_exceptions=True,
+        )
 
-            browser.close()
-            return reviews
+        results = {}
+        for place_id, place_reviews in zip(place_ids, all_results):
+            if isinstance(place_reviews, BaseException):
+                logger.error(f"{place_id} 리뷰 크롤링 실패: {str(place_reviews)}")
+                continue
+            results[place_id] = place_reviews
+        return results
 
 
 # 사용 예시
-def main():
+async def main():
     try:
-        crawler = NaverMapReviewCrawler(headless=False)
+        async with NaverMapReviewCrawler(headless=False) as crawler:
+            # 예시: 특정 장소의 리뷰 크롤링
+            place_id = "1234567890"  # 실제 place_id로 변경
+            existing_review_ids = set()  # 기존 리뷰 ID들
 
-        # 예시: 특정 장소의 리뷰 크롤링
-        place_id = "1234567890"  # 실제 place_id로 변경
-        existing_review_ids = set()  # 기존 리뷰 ID들
-
-        reviews = crawler.crawl_all_reviews(place_id, existing_review_ids)
+            reviews = []
+            await crawler.crawl_all_reviews(
+                place_id, existing_review_ids, reviews.extend
+            )
 
         print(f"\n총 {len(reviews)}개의 리뷰를 수집했습니다.")
         for i, review in enumerate(reviews[:5], 1):  # 처음 5개만 출력
@@ -332,4 +511,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s"
+    )
+    asyncio.run(main())
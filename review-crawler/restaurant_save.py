@@ -1,15 +1,42 @@
-import json
+import orjson
 import boto3
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime
+from botocore.config import Config
+from sqlalchemy import (
+    create_engine,
+    text,
+    Column,
+    Integer,
+    String,
+    Float,
+    DateTime,
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 import os
+from operator import itemgetter
 from typing import List, Dict
 
 # SQLAlchemy Base
 Base = declarative_base()
 
+# Required restaurant fields, read in one call per row in save_to_rds
+get_restaurant_fields = itemgetter("name", "address", "latitude", "longitude")
+
+
+# Insert a restaurant only if no row with the same (name, address) exists.
+# The comparison runs in MySQL under the columns' collation, so it matches
+# exactly what the database considers a duplicate; run as an executemany,
+# each row also sees the rows inserted before it in the same transaction
+INSERT_IF_NOT_EXISTS = text(
+    """
+    INSERT INTO restaurant (name, address, latitude, longitude, thumbnail)
+    SELECT :name, :address, :latitude, :longitude, :thumbnail FROM DUAL
+    WHERE NOT EXISTS (
+        SELECT 1 FROM restaurant WHERE name = :name AND address = :address
+    )
+    """
+)
+
 
 # Restaurant Entity (Python version matching Java entity)
 class Restaurant(Base):
@@ -44,6 +71,11 @@ class S3ToRDSLoader:
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=aws_region,
+            config=Config(
+                max_pool_connections=50,
+                tcp_keepalive=True,
+                retries={"mode": "adaptive", "total_max_attempts": 5},
+            ),
         )
         self.s3_bucket = s3_bucket
         self.s3_key = s3_key
@@ -51,18 +83,18 @@ class S3ToRDSLoader:
         # Database setup
         self.engine = create_engine(
             f"mysql+pymysql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}",
-            echo=True,  # Set to False in production
+            echo=False,  # Set to True to log every SQL statement
+            pool_size=5,
+            pool_pre_ping=True,
         )
         Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
 
     def read_from_s3(self) -> List[Dict]:
         """Read JSON data from S3"""
         try:
             response = self.s3_client.get_object(Bucket=self.s3_bucket, Key=self.s3_key)
-            content = response["Body"].read().decode("utf-8")
-            data = json.loads(content)
+            # Parse the raw bytes directly (no intermediate str copy)
+            data = orjson.loads(response["Body"].read())
             print(f"Successfully read {len(data)} records from S3")
             return data
         except Exception as e:
@@ -71,63 +103,45 @@ class S3ToRDSLoader:
 
     def save_to_rds(self, restaurants_data: List[Dict]) -> int:
         """Save restaurant data to RDS"""
-        saved_count = 0
-
         try:
+            # Normalize rows first (same defaults as before)
+            rows = []
             for restaurant_data in restaurants_data:
-                # Check if restaurant already exists by name and address
-                existing = (
-                    self.session.query(Restaurant)
-                    .filter_by(
-                        name=restaurant_data["name"], address=restaurant_data["address"]
-                    )
-                    .first()
+                name, address, latitude, longitude = get_restaurant_fields(
+                    restaurant_data
                 )
-
-                if existing:
-                    print(
-                        f"Restaurant already exists: {restaurant_data['name']} at {restaurant_data['address']}"
-                    )
-                    continue
-                print(restaurant_data)
-                # Create new restaurant
-                restaurant = Restaurant(
-                    name=restaurant_data["name"],
-                    address=(
-                        restaurant_data["address"]
-                        if restaurant_data["address"] is not None
-                        else ""
-                    ),
-                    latitude=(
-                        restaurant_data["latitude"]
-                        if restaurant_data["latitude"] is not None
-                        else 0
-                    ),
-                    longitude=(
-                        restaurant_data["longitude"]
-                        if restaurant_data["longitude"] is not None
-                        else 0
-                    ),
-                    thumbnail=restaurant_data.get(
-                        "thumbnail", None
-                    ),  # thumbnail is optional
+                rows.append(
+                    {
+                        "name": name,
+                        "address": address if address is not None else "",
+                        "latitude": latitude if latitude is not None else 0,
+                        "longitude": longitude if longitude is not None else 0,
+                        "thumbnail": restaurant_data.get(
+                            "thumbnail", None
+                        ),  # thumbnail is optional
+                    }
                 )
 
-                self.session.add(restaurant)
-                saved_count += 1
-                print(f"Added restaurant: {restaurant.name}")
+            if not rows:
+                print("No restaurants to save")
+                return 0
+
+            # Core on a single connection (no ORM session / identity map);
+            # the transaction commits on success and rolls back on error.
+            # The database decides which rows already exist (see INSERT_IF_NOT_EXISTS)
+            with self.engine.begin() as conn:
+                result = conn.execute(INSERT_IF_NOT_EXISTS, rows)
+                saved_count = result.rowcount
 
-            # Commit all changes
-            self.session.commit()
+            skipped_count = len(rows) - saved_count
+            if skipped_count:
+                print(f"{skipped_count} restaurants already exist, skipping")
             print(f"Successfully saved {saved_count} new restaurants to RDS")
             return saved_count
 
         except Exception as e:
-            self.session.rollback()
             print(f"Error saving to RDS: {e}")
             raise
-        finally:
-            self.session.close()
 
     def load_data(self):
         """Main method to load data from S3 to RDS"""
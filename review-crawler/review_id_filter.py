@@ -0,0 +1,37 @@
+from typing import FrozenSet, Iterable
+
+# 리뷰 ID 길이 (blake2b 64bit hex)
+REVIEW_ID_LENGTH = 16
+
+# 기존(SHA-256) 리뷰 ID 길이
+LEGACY_REVIEW_ID_LENGTH = 64
+
+
+def get_review_id_length(review_ids: Iterable[str]) -> int:
+    """기존 리뷰 ID와 같은 형식으로 ID를 만들기 위한 길이 반환
+
+    ID 형식은 바뀔 때마다 짧아졌으므로 가장 짧은 길이가 가장 최근 형식
+    (기존 ID가 없으면 REVIEW_ID_LENGTH)
+    """
+    return min((len(review_id) for review_id in review_ids), default=REVIEW_ID_LENGTH)
+
+
+class ReviewIdFilter:
+    """기존 리뷰 id 멤버십 검사용 집합
+
+    이미 내려받은 id 리스트로 한 번만 만들고 S3에서 다시 조회하지 않음
+    (hex 문자열 대신 정수로 보관해서 메모리와 해시 비용을 줄임)
+    """
+
+    def __init__(self, review_ids: Iterable[str]):
+        review_ids = list(review_ids)
+        self.id_length = get_review_id_length(review_ids)
+        self._review_ids: FrozenSet[int] = frozenset(
+            int(review_id, 16) for review_id in review_ids
+        )
+
+    def __len__(self) -> int:
+        return len(self._review_ids)
+
+    def __contains__(self, review_id: str) -> bool:
+        return int(review_id, 16) in self._review_ids
@@ -1,10 +1,31 @@
 import boto3
-import json
+from botocore.config import Config
+import orjson
 import logging
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from review_id_filter import ReviewIdFilter
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
+# S3 클라이언트 설정 (연결 풀/keep-alive 재사용, 적응형 재시도)
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "total_max_attempts": 5},
+)
+
+# 리뷰 id 파일 prefix (ids/{place_id}/{shard}.ids)
+# 리뷰 파일과 분리해서 리뷰 파일(.json)로 트리거되는 Lambda가 실행되지 않게 함
+REVIEW_IDS_PREFIX = "ids"
+
+# 기존(리뷰 파일 shard 도입 전) 리뷰 id를 옮겨 담는 파일 이름
+LEGACY_IDS_SHARD = "legacy"
+
+# id 파일 동시 다운로드 개수
+IDS_MAX_WORKERS = 8
+
 
 class ReviewStorageManager:
     def __init__(
@@ -13,53 +34,111 @@ class ReviewStorageManager:
         aws_access_key_id=None,
         aws_secret_access_key=None,
         region_name=None,
+        s3_client=None,
     ):
         self.bucket_name = bucket_name
-        self.s3 = boto3.client(
+        # 클라이언트를 넘겨받으면 재사용 (Lambda warm start 시 연결 유지)
+        self.s3 = s3_client or boto3.client(
             "s3",
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=region_name,
+            config=S3_CLIENT_CONFIG,
         )
 
     def upload_reviews_json(self, place_id, reviews):
         """
-        리뷰 리스트(reviews)를 S3의 bucket에 place_id.json 파일로 저장
-        기존 파일이 있으면 합치기
+        이번에 수집한 리뷰 리스트(reviews)만 S3의 place_id/ 아래 새 파일로 저장
+        리뷰 id는 같은 shard 이름으로 ids/place_id/ 아래 별도 파일에 저장
+        (기존 파일은 다시 읽고 쓰지 않으므로 동시에 업로드해도 서로 덮어쓰지 않음)
         """
-        key = f"{place_id}.json"
+        shard = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+        key = f"{place_id}/{shard}.json"
 
-        # 기존 파일 확인 및 읽기
-        existing_reviews = []
+        # id 파일이 하나도 없으면 기존 방식으로 저장된 id를 먼저 옮겨 둠
+        if not self._list_review_ids_keys(place_id):
+            self._migrate_legacy_review_ids(place_id)
+
+        # 리뷰 id만 한 줄에 하나씩 저장 (기존 id 조회 시 S3 Select 없이 사용)
+        # 리뷰 파일보다 먼저 저장해서, 리뷰 파일만 남고 id가 빠지는 경우가 없게 함
+        # (id가 빠지면 다음 크롤링에서 같은 리뷰를 다시 수집해서 다시 전송함)
+        self._put_review_ids(place_id, shard, [review["id"] for review in reviews])
+
+        # S3에 저장 (실패하면 방금 저장한 id 파일을 지워서 다음 크롤링에서 다시 수집)
         try:
-            response = self.s3.get_object(Bucket=self.bucket_name, Key=key)
-            existing_data = response["Body"].read().decode("utf-8")
-            existing_reviews = json.loads(existing_data)
-            logger.info(f"기존 리뷰 {len(existing_reviews)}개 발견")
-        except self.s3.exceptions.NoSuchKey:
-            logger.info(f"{key} 파일이 없어서 새로 생성")
-        except Exception as e:
-            logger.error(f"파일 읽기 오류: {e}")
-
-        # 기존 리뷰와 새 리뷰 합치기
-        all_reviews = existing_reviews + reviews
-
-        # 중복 제거가 필요한 경우 (예: review_id로 중복 체크)
-        # seen = set()
-        # unique_reviews = []
-        # for review in all_reviews:
-        #     if review.get('review_id') not in seen:
-        #         seen.add(review.get('review_id'))
-        #         unique_reviews.append(review)
-        # all_reviews = unique_reviews
-
-        # S3에 저장
-        data = json.dumps(all_reviews, ensure_ascii=False, indent=2)
-        self.s3.put_object(Bucket=self.bucket_name, Key=key, Body=data.encode("utf-8"))
+            self.s3.put_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=orjson.dumps(reviews),
+                ContentType="application/json",
+            )
+        except Exception:
+            self.s3.delete_object(
+                Bucket=self.bucket_name, Key=self._review_ids_key(place_id, shard)
+            )
+            raise
+        logger.info(
+            f"Uploaded {key} to S3 bucket {self.bucket_name} (신규 {len(reviews)}개 리뷰)"
+        )
+
+    def _review_ids_key(self, place_id, shard):
+        return f"{REVIEW_IDS_PREFIX}/{place_id}/{shard}.ids"
+
+    def _put_review_ids(self, place_id, shard, review_ids):
+        ids_key = self._review_ids_key(place_id, shard)
+        self.s3.put_object(
+            Bucket=self.bucket_name,
+            Key=ids_key,
+            Body="\n".join(review_ids).encode("utf-8"),
+        )
         logger.info(
-            f"Uploaded {key} to S3 bucket {self.bucket_name} (총 {len(all_reviews)}개 리뷰)"
+            f"Uploaded {ids_key} to S3 bucket {self.bucket_name} ({len(review_ids)}개 id)"
         )
 
+    def _list_review_ids_keys(self, place_id):
+        """
+        place_id의 id 파일 key 목록 반환
+        """
+        keys = []
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.bucket_name, Prefix=f"{REVIEW_IDS_PREFIX}/{place_id}/"
+        ):
+            for obj in page.get("Contents", []):
+                keys.append(obj["Key"])
+        return keys
+
+    def _read_review_ids(self, key):
+        response = self.s3.get_object(Bucket=self.bucket_name, Key=key)
+        return response["Body"].read().decode("utf-8").splitlines()
+
+    def _migrate_legacy_review_ids(self, place_id):
+        """
+        기존 방식으로 저장된 리뷰 id를 ids/place_id/legacy.ids로 복사
+        (동시에 실행돼도 같은 내용을 쓰므로 안전)
+        """
+        legacy_ids = self.get_review_ids_with_s3_select(place_id)
+        if legacy_ids:
+            self._put_review_ids(place_id, LEGACY_IDS_SHARD, legacy_ids)
+
+    def get_review_ids(self, place_id):
+        """
+        ids/place_id/ 아래 id 파일들을 모두 읽어서 리뷰 id 리스트 반환
+        id 파일이 없으면 (이전 방식으로 저장된 데이터) 기존 파일에서 조회
+        """
+        keys = self._list_review_ids_keys(place_id)
+        if not keys:
+            logger.info(f"{place_id}의 id 파일이 없어서 S3 Select로 조회")
+            return self.get_review_ids_with_s3_select(place_id)
+
+        review_ids = []
+        with ThreadPoolExecutor(max_workers=IDS_MAX_WORKERS) as executor:
+            for key_ids in executor.map(self._read_review_ids, keys):
+                review_ids.extend(key_ids)
+
+        logger.info(f"기존 리뷰 id {len(review_ids)}개 조회 (id 파일 {len(keys)}개)")
+        return review_ids
+
     def get_review_ids_with_s3_select(self, place_id):
         """
         S3 Select를 사용해 place_id.json 파일에서 리뷰 id만 리스트로 반환
@@ -67,34 +146,34 @@ class ReviewStorageManager:
         key = f"{place_id}.json"
         logger.info(key)
         try:
+            # id만 projection하고, 레코드 구분자를 ","로 받아서 JSON 배열로 한 번에 파싱
             response = self.s3.select_object_content(
                 Bucket=self.bucket_name,
                 Key=key,
                 ExpressionType="SQL",
-                Expression="SELECT * FROM S3Object[*] s",
+                Expression="SELECT s.id FROM S3Object[*][*] s",
                 InputSerialization={"JSON": {"Type": "DOCUMENT"}},
-                OutputSerialization={"JSON": {}},
+                OutputSerialization={"JSON": {"RecordDelimiter": ","}},
             )
 
             # 모든 데이터를 먼저 수집
-            all_data = b""
+            all_data = bytearray(b"[")
             for event in response["Payload"]:
                 if "Records" in event:
                     all_data += event["Records"]["Payload"]
+            all_data = all_data.rstrip(b",") + b"]"
 
             # 한 번에 디코딩하고 처리
-            ids = []
-            if all_data:
-                records = all_data.decode("utf-8")
-                for line in records.strip().split("\n"):
-                    if line:
-                        obj = json.loads(line)["_1"]
-                        for object in obj:
-                            logger.info(object["id"])
-                            ids.append(object["id"])
-
-            logger.info(ids)
+            ids = [record["id"] for record in orjson.loads(all_data) if "id" in record]
+
+            logger.info(f"기존 리뷰 id {len(ids)}개 조회")
             return ids
         except Exception as e:
             logger.error(f"S3 Select error: {e}")
             return []
+
+    def get_existing_review_ids(self, place_id):
+        """
+        기존 리뷰 id를 ReviewIdFilter로 반환 (id 파일은 한 번만 내려받음)
+        """
+        return ReviewIdFilter(self.get_review_ids(place_id))
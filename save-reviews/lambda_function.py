@@ -1,18 +1,115 @@
 import json
 import boto3
+from botocore.config import Config
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 from urllib.parse import unquote_plus
-import urllib.request
-import urllib.error
+import random
+import threading
+import urllib3
+from concurrent.futures import ThreadPoolExecutor
 
 # 로거 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# S3 클라이언트 초기화
-s3 = boto3.client("s3")
+# S3 클라이언트 초기화 (keep-alive 재사용, 적응형 재시도)
+s3 = boto3.client(
+    "s3",
+    config=Config(
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "total_max_attempts": 5},
+    ),
+)
+
+# API 동시 전송 스레드 수
+MAX_WORKERS = 10
+
+# Retry-After 헤더를 따를 때 최대 대기 시간 (초)
+# (큰 값 때문에 Lambda 스레드가 오래 멈추지 않게 제한)
+RETRY_AFTER_MAX = 5.0
+
+
+class ReviewApiRetry(urllib3.Retry):
+    """Retry-After는 RETRY_AFTER_MAX까지만 따르고, 백오프에는 jitter를 적용
+    (여러 스레드가 429를 동시에 받아도 같은 시각에 다시 요청하지 않게 함)"""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX)
+
+    def get_backoff_time(self):
+        # full jitter: 0 ~ 지수 백오프 시간 사이에서 무작위로 대기
+        return random.uniform(0, super().get_backoff_time())
+
+
+class AdaptiveConcurrencyLimiter:
+    """API 동시 요청 수를 AIMD 방식으로 조절
+    429를 받으면 허용 동시 요청 수를 절반으로 줄이고, 성공할 때마다 1씩 늘림"""
+
+    def __init__(self, max_limit: int):
+        self._max_limit = max_limit
+        self._limit = max_limit
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def __enter__(self):
+        with self._condition:
+            while self._in_flight >= self._limit:
+                self._condition.wait()
+            self._in_flight += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def on_throttled(self):
+        with self._condition:
+            self._limit = max(1, self._limit // 2)
+            logger.warning(f"API 429 응답, 동시 요청 수를 {self._limit}개로 줄임")
+
+    def on_success(self):
+        with self._condition:
+            if self._limit < self._max_limit:
+                self._limit += 1
+                self._condition.notify_all()
+
+
+# API 동시 요청 수 제한 (스레드 간 공유)
+api_limiter = AdaptiveConcurrencyLimiter(MAX_WORKERS)
+
+# API 호출용 연결 풀 (스레드 간 keep-alive 연결 공유)
+# POST는 멱등이 아니므로 서버가 요청을 처리하지 않았다고 알려주는 429/503만 재시도
+# (502/504나 응답 읽기 오류는 서버에 이미 저장됐을 수 있어 재시도하지 않음)
+# Retry-After가 있으면 RETRY_AFTER_MAX까지만 따르고, 없으면 jitter를 적용한 지수 백오프
+http = urllib3.PoolManager(
+    maxsize=MAX_WORKERS,
+    retries=ReviewApiRetry(
+        total=3,
+        backoff_factor=0.3,
+        read=0,
+        status_forcelist=[429, 503],
+        allowed_methods=None,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+    timeout=urllib3.Timeout(total=10),
+    # 모든 요청이 JSON POST라 공통 헤더는 한 번만 설정 (Content-Length는 urllib3가 추가)
+    headers={"Content-Type": "application/json"},
+)
+
+
+def _is_throttled(response) -> bool:
+    """최종 응답이나 재시도 중 받은 응답에 429가 있었는지 확인"""
+    if response.status == 429:
+        return True
+    history = response.retries.history if response.retries else ()
+    return any(request.status == 429 for request in history)
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -27,6 +124,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         처리 결과를 담은 딕셔너리
     """
 
+    # 처리할 레코드가 없으면(예: S3 테스트 이벤트) 바로 종료
+    if not event.get("Records"):
+        logger.info("No S3 records in event, nothing to process")
+        return {"statusCode": 204, "body": "{}"}
+
     # API URL 환경 변수에서 가져오기
     api_url = os.environ.get("API_URL")
     if not api_url:
@@ -54,6 +156,21 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if not isinstance(reviews, list):
             raise ValueError("File content is not a list of reviews")
 
+        if not reviews:
+            logger.info("No reviews to process")
+            return {
+                "statusCode": 200,
+                "body": json.dumps(
+                    {
+                        "message": "Processing complete",
+                        "file": f"{bucket}/{key}",
+                        "total_reviews": 0,
+                        "success_count": 0,
+                        "failed_count": 0,
+                    }
+                ),
+            }
+
         logger.info(f"Found {len(reviews)} reviews to process")
 
         # 처리 결과 저장
@@ -61,37 +178,18 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         failed_count = 0
         errors = []
 
-        # 각 리뷰에 대해 API 호출
-        for review in reviews[:10]:
-            try:
-                print(review)
-                # 요청 데이터 준비
-                request_data = {
-                    "restaurantId": int(review.get("place_id", 0)),
-                    "content": review.get("content", ""),
-                    "hash": review.get("id", ""),
-                }
-
-                # API 호출
-                result = send_review_to_api(api_url, request_data)
-
-                if result["success"]:
+        # 각 리뷰에 대해 API 호출 (I/O 대기이므로 스레드로 동시 전송)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = executor.map(
+                lambda review: process_review(api_url, review), reviews[:10]
+            )
+            for error_msg in results:
+                if error_msg is None:
                     success_count += 1
-                    logger.info(f"Successfully sent review {request_data['hash']}")
                 else:
                     failed_count += 1
-                    error_msg = f"Failed to send review {request_data['hash']}: {result['error']}"
-                    logger.error(error_msg)
                     errors.append(error_msg)
 
-            except Exception as e:
-                failed_count += 1
-                error_msg = (
-                    f"Error processing review {review.get('id', 'unknown')}: {str(e)}"
-                )
-                logger.error(error_msg)
-                errors.append(error_msg)
-
         # 처리 결과 로깅
         logger.info(
             f"Processing complete. Success: {success_count}, Failed: {failed_count}"
@@ -121,6 +219,40 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         }
 
 
+def process_review(api_url: str, review: Dict[str, Any]) -> Optional[str]:
+    """
+    리뷰 하나를 API 요청 형식으로 변환해서 전송
+
+    Args:
+        api_url: API 엔드포인트 URL
+        review: S3 파일의 리뷰 데이터
+
+    Returns:
+        성공하면 None, 실패하면 에러 메시지
+    """
+    try:
+        logger.debug("review=%s", review)
+        # 요청 데이터 준비
+        request_data = {
+            "restaurantId": int(review.get("place_id", 0)),
+            "content": review.get("content", ""),
+            "hash": review.get("id", ""),
+        }
+
+        # API 호출
+        result = send_review_to_api(api_url, request_data)
+
+        if result["success"]:
+            logger.info(f"Successfully sent review {request_data['hash']}")
+            return None
+
+        error_msg = f"Failed to send review {request_data['hash']}: {result['error']}"
+    except Exception as e:
+        error_msg = f"Error processing review {review.get('id', 'unknown')}: {str(e)}"
+    logger.error(error_msg)
+    return error_msg
+
+
 def send_review_to_api(api_url: str, review_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     리뷰 데이터를 API로 전송
@@ -136,39 +268,35 @@ def send_review_to_api(api_url: str, review_data: Dict[str, Any]) -> Dict[str, A
         # JSON 데이터 준비
         json_data = json.dumps(review_data).encode("utf-8")
 
-        # HTTP 요청 생성
-        req = urllib.request.Request(
-            api_url + "/api/crawling-review",
-            data=json_data,
-            headers={
-                "Content-Type": "application/json",
-                "Content-Length": str(len(json_data)),
-            },
-            method="POST",
-        )
-
-        # API 호출 (타임아웃 10초)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            response_data = response.read().decode("utf-8")
-
-            # 성공적인 응답 (2xx)
-            if 200 <= response.getcode() < 300:
-                return {
-                    "success": True,
-                    "response": response_data,
-                    "status_code": response.getcode(),
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"HTTP {response.getcode()}: {response_data}",
-                }
+        # API 호출 (타임아웃 10초, 429/503은 백오프 후 재시도)
+        # 429를 받으면 이후 동시 요청 수를 줄이고, 성공하면 다시 늘림
+        with api_limiter:
+            response = http.request(
+                "POST",
+                api_url + "/api/crawling-review",
+                body=json_data,
+            )
+        if _is_throttled(response):
+            api_limiter.on_throttled()
+        elif 200 <= response.status < 300:
+            api_limiter.on_success()
+        response_data = response.data.decode("utf-8")
+
+        # 성공적인 응답 (2xx)
+        if 200 <= response.status < 300:
+            return {
+                "success": True,
+                "response": response_data,
+                "status_code": response.status,
+            }
+        else:
+            return {
+                "success": False,
+                "error": f"HTTP {response.status}: {response_data}",
+            }
 
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode("utf-8") if e.fp else "No error body"
-        return {"success": False, "error": f"HTTP {e.code}: {error_body}"}
-    except urllib.error.URLError as e:
-        return {"success": False, "error": f"URL Error: {str(e.reason)}"}
+    except urllib3.exceptions.HTTPError as e:
+        return {"success": False, "error": f"URL Error: {str(e)}"}
     except Exception as e:
         return {"success": False, "error": f"Unexpected error: {str(e)}"}
 
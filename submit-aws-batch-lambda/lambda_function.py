@@ -1,19 +1,38 @@
 import json
 import boto3
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import logging
 import time
 from urllib.parse import unquote_plus
-import urllib.request
+import urllib3
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 
 # 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# AWS 클라이언트 설정 (연결 풀/keep-alive 재사용, 적응형 재시도)
+# submit_job을 여러 스레드에서 동시에 호출하므로 연결 풀을 스레드 수보다 크게 설정
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "total_max_attempts": 5},
+)
+
 # AWS 클라이언트 초기화
-s3_client = boto3.client("s3")
-batch_client = boto3.client("batch")
+s3_client = boto3.client("s3", config=CLIENT_CONFIG)
+batch_client = boto3.client("batch", config=CLIENT_CONFIG)
+
+# 레스토랑 저장 + Batch 작업 제출 동시 실행 스레드 수
+MAX_WORKERS = 16
+
+# 식당 데이터가 아닌 크롤러 내부 파일 prefix
+INTERNAL_KEY_PREFIX = "_cache/"
+
+# 레스토랑 데이터 필수 필드
+REQUIRED_FIELDS = frozenset(("placeId", "name", "address", "latitude", "longitude"))
 
 # 환경변수
 JOB_QUEUE = os.environ.get("BATCH_JOB_QUEUE", "default-queue")
@@ -22,34 +41,67 @@ API_URL = os.environ.get(
     "API_URL", "http://localhost:8080/api/restaurant"
 )  # 추가: API URL 환경변수
 
+# API 호출용 연결 풀 (warm start 시 keep-alive 연결 재사용)
+# POST는 멱등이 아니므로 서버가 요청을 처리하지 않았다고 알려주는 429/503만 재시도
+# (502/504나 응답 읽기 오류는 서버에 이미 저장됐을 수 있어 재시도하지 않음)
+# Retry-After는 따르지 않고 짧은 지수 백오프(0.3초 단위, 최대 3회)만 사용해서
+# 큰 Retry-After 값 때문에 Lambda 스레드가 오래 멈추지 않게 함
+http = urllib3.PoolManager(
+    maxsize=50,
+    retries=urllib3.Retry(
+        total=3,
+        backoff_factor=0.3,
+        read=0,
+        status_forcelist=[429, 503],
+        allowed_methods=None,
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    ),
+    timeout=urllib3.Timeout(total=10),
+    # 모든 요청이 JSON POST라 공통 헤더는 한 번만 설정 (Content-Length는 urllib3가 추가)
+    headers={"Content-Type": "application/json"},
+)
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     S3 이벤트를 처리하고 JSON 파일에서 placeId를 추출하여 DB에 저장 후 Batch 작업 실행
     """
+    # 처리할 레코드가 없으면(예: S3 테스트 이벤트) 바로 종료
+    records = event.get("Records") or []
+    if not records:
+        logger.info("No S3 records in event, nothing to process")
+        return {"statusCode": 204, "body": "{}"}
+
     total_submitted_jobs = 0
     total_saved_restaurants = 0
     try:
-        for record in event["Records"]:
+        for record in records:
             s3_event = record["s3"]
             bucket_name = s3_event["bucket"]["name"]
             object_key = s3_event["object"]["key"]
             object_key = unquote_plus(object_key)
 
+            # 크롤러 내부 캐시 파일(예: _cache/geocode_cache.json)은 식당 데이터가 아니므로 건너뜀
+            if object_key.startswith(INTERNAL_KEY_PREFIX):
+                logger.info(f"Skipping internal file: s3://{bucket_name}/{object_key}")
+                continue
+
             logger.info(f"Processing file: s3://{bucket_name}/{object_key}")
 
             data = load_json_from_s3(bucket_name, object_key)
             logger.info(f"Successfully loaded JSON from {object_key}")
+            if not data:
+                logger.warning(f"No restaurant data found in {object_key}")
+                continue
 
-            saved_restaurants = save_restaurants_to_db(data)
+            saved_restaurants, job_responses = save_restaurants_and_submit_jobs(
+                data, bucket_name, object_key
+            )
             total_saved_restaurants += len(saved_restaurants)
             logger.info(
                 f"Saved {len(saved_restaurants)} restaurants to DB from {object_key}"
             )
-
-            job_responses = submit_batch_jobs_for_restaurants(
-                saved_restaurants, bucket_name, object_key
-            )
             total_submitted_jobs += len(job_responses)
             logger.info(f"Submitted {len(job_responses)} batch jobs for {object_key}")
 
@@ -80,8 +132,8 @@ def load_json_from_s3(bucket_name: str, object_key: str) -> Any:
     return json.loads(file_content)
 
 
-def save_restaurants_to_db(data: Any) -> List[Dict[str, Any]]:
-    saved_restaurants = []
+def get_valid_restaurants(data: Any) -> List[Dict[str, Any]]:
+    """JSON 데이터에서 필수 필드가 모두 있는 레스토랑만 추출"""
     restaurants = []
     if isinstance(data, list):
         restaurants = data
@@ -92,49 +144,82 @@ def save_restaurants_to_db(data: Any) -> List[Dict[str, Any]]:
 
     if not restaurants:
         logger.warning("No restaurant data found in JSON")
-        return saved_restaurants
+        return []
 
     if not API_URL:
         logger.error("API_URL 환경변수가 설정되어 있지 않습니다.")
-        return saved_restaurants
+        return []
 
+    valid_restaurants = []
     for restaurant in restaurants:
         if not isinstance(restaurant, dict):
             continue
         if not is_valid_restaurant(restaurant):
             logger.warning(f"Missing required fields in restaurant data: {restaurant}")
             continue
-        print(restaurant)
+        valid_restaurants.append(restaurant)
+    return valid_restaurants
+
+
+def save_restaurants_and_submit_jobs(
+    data: Any, bucket_name: str, object_key: str
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """레스토랑을 API로 저장하고 저장된 레스토랑마다 바로 Batch 작업 제출
+    (전체 저장이 끝날 때까지 기다리지 않고 레스토랑별로 저장 -> 제출을 스레드로 동시 실행)
+
+    Returns:
+        (저장된 레스토랑 리스트, Batch 작업 응답 리스트)
+    """
+
+    def save_and_submit(
+        restaurant: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        logger.debug("restaurant=%s", restaurant)
         saved_data = post_restaurant_to_api(restaurant)
-        if saved_data:
-            saved_restaurants.append(saved_data)
-    return saved_restaurants
+        if not saved_data:
+            return {}, {}
+        return saved_data, submit_batch_job_for_restaurant(
+            saved_data, bucket_name, object_key
+        )
+
+    saved_restaurants = []
+    job_responses = []
+    restaurants = get_valid_restaurants(data)
+    if not restaurants:
+        return saved_restaurants, job_responses
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for saved_data, job_response in executor.map(save_and_submit, restaurants):
+            if saved_data:
+                saved_restaurants.append(saved_data)
+            if job_response:
+                job_responses.append(job_response)
+    return saved_restaurants, job_responses
 
 
 def is_valid_restaurant(restaurant: Dict[str, Any]) -> bool:
-    required_fields = ["placeId", "name", "address", "latitude", "longitude"]
-    return all(field in restaurant for field in required_fields)
+    return REQUIRED_FIELDS.issubset(restaurant)
 
 
 def post_restaurant_to_api(restaurant: Dict[str, Any]) -> Dict[str, Any]:
+    """레스토랑을 API로 저장 (성공하면 요청한 레스토랑, 실패하면 빈 딕셔너리 반환)"""
     try:
-        req = urllib.request.Request(
+        response = http.request(
+            "POST",
             API_URL + "/api/restaurant",
-            data=json.dumps(restaurant).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
+            body=json.dumps(restaurant).encode("utf-8"),
         )
-        with urllib.request.urlopen(req, timeout=10) as response:
-            if response.status == 200 or response.status == 201:
-                logger.info(
-                    f"Saved restaurant via API: {restaurant['name']} (placeId: {restaurant['placeId']})"
-                )
-                return json.loads(response.read().decode("utf-8"))
-            else:
-                logger.error(
-                    f"API 저장 실패: {restaurant.get('placeId', 'unknown')} - status {response.status}, response: {response.read().decode('utf-8')}"
-                )
-                return {}
+        if response.status == 200 or response.status == 201:
+            logger.info(
+                f"Saved restaurant via API: {restaurant['name']} (placeId: {restaurant['placeId']})"
+            )
+            # 응답 본문은 사용하지 않으므로 파싱하지 않고 저장한 데이터를 그대로 반환
+            return restaurant
+        else:
+            logger.error(
+                f"API 저장 실패: {restaurant.get('placeId', 'unknown')} - status {response.status}, response: {response.data.decode('utf-8')}"
+            )
+            return {}
     except Exception as e:
         logger.error(
             f"Error saving restaurant {restaurant.get('placeId', 'unknown')} via API: {str(e)}"
@@ -142,24 +227,21 @@ def post_restaurant_to_api(restaurant: Dict[str, Any]) -> Dict[str, Any]:
         return {}
 
 
-def submit_batch_jobs_for_restaurants(
-    restaurants: List[Dict[str, Any]], bucket_name: str, object_key: str
-) -> List[Dict[str, Any]]:
-    job_responses = []
-    for restaurant in restaurants:
-        try:
-            job_response = submit_batch_job(
-                placeId=restaurant["placeId"],
-                source_bucket=bucket_name,
-                source_key=object_key,
-            )
-            if job_response:
-                job_responses.append(job_response)
-        except Exception as e:
-            logger.error(
-                f"Error submitting batch job for placeId {restaurant.get('placeId', 'unknown')}: {str(e)}"
-            )
-    return job_responses
+def submit_batch_job_for_restaurant(
+    restaurant: Dict[str, Any], bucket_name: str, object_key: str
+) -> Dict[str, Any]:
+    """저장된 레스토랑의 Batch 작업 제출 (실패 시 로그만 남기고 빈 딕셔너리 반환)"""
+    try:
+        return submit_batch_job(
+            placeId=restaurant["placeId"],
+            source_bucket=bucket_name,
+            source_key=object_key,
+        )
+    except Exception as e:
+        logger.error(
+            f"Error submitting batch job for placeId {restaurant.get('placeId', 'unknown')}: {str(e)}"
+        )
+        return {}
 
 
 def submit_batch_job(
@@ -193,49 +275,24 @@ def extract_placeIds(data: Any) -> List[str]:
     Returns:
         placeId 리스트
     """
-    placeIds = []
-
-    # 데이터가 리스트인 경우
+    # 데이터가 딕셔너리인 경우 리스트 값들을 모두 대상으로 함
     if isinstance(data, list):
-        for item in data:
-            if isinstance(item, dict) and "placeId" in item:
-                placeId = item.get("placeId")
-                if placeId:
-                    placeIds.append(str(placeId))
-
-    # 중복 제거
-    return list(set(placeIds))
-
-
-def process_large_file(
-    bucket: str, key: str, chunk_size: int = 1024 * 1024
-) -> List[str]:
-    """
-    대용량 JSON 파일을 스트리밍으로 처리
-    """
-    placeIds = []
-
-    try:
-        response = s3_client.get_object(Bucket=bucket, Key=key)
-
-        # 스트리밍 파싱 대신 일반 파싱 사용 (ijson 없이)
-        file_content = response["Body"].read().decode("utf-8")
-        data = json.loads(file_content)
-
-        # 데이터가 리스트인 경우
-        if isinstance(data, list):
-            for obj in data:
-                if isinstance(obj, dict) and "placeId" in obj:
-                    placeIds.append(str(obj["placeId"]))
-        # 데이터가 딕셔너리인 경우
-        elif isinstance(data, dict):
-            # extract_placeIds 함수 재사용
-            placeIds = extract_placeIds(data)
-
-    except Exception as e:
-        logger.error(f"Error processing large file: {str(e)}")
-
-    return placeIds
+        items = data
+    elif isinstance(data, dict):
+        items = (
+            item for value in data.values() if isinstance(value, list) for item in value
+        )
+    else:
+        return []
+
+    # 한 번 순회하면서 set으로 바로 중복 제거
+    return list(
+        {
+            str(item["placeId"])
+            for item in items
+            if isinstance(item, dict) and item.get("placeId")
+        }
+    )
 
 
 # 테스트용 로컬 실행